@@ -3,13 +3,23 @@ import os
 import time
 import logging
 import datetime
-from scraper_interactive import RedHatEventsInteractiveScraper
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from data_processor import EventDataProcessor
-from utils import load_last_run_data, save_last_run_data, compare_events, ensure_directory, clean_screenshots
+from utils import load_last_run_data, save_last_run_data, compare_events, events_digest, ensure_directory, clean_screenshots
 from config import DEFAULT_FILTERS, BATCH_FREQUENCY_DAYS, OUTPUT_DIR
 
 logger = logging.getLogger(__name__)
 
+# Longest single sleep while waiting for the next continuous run, in seconds
+WAKE_CHECK_SECONDS = 60
+
+# Outputs produced by a run, shared by every caller instead of separate flags
+ExportPlan = namedtuple('ExportPlan', ['excel', 'csv', 'sheets'])
+
+# Excel and CSV files, without the optional Google Sheets upload
+DEFAULT_EXPORT_PLAN = ExportPlan(excel=True, csv=True, sheets=False)
+
 class BatchRunner:
     def __init__(self, filters=None, interval_days=BATCH_FREQUENCY_DAYS, output_dir=OUTPUT_DIR, headless=True):
         """
@@ -30,6 +40,9 @@ class BatchRunner:
         # Create the processor first
         self.processor = EventDataProcessor(output_dir=self.output_dir)
     
+        # Imported here so loading this module doesn't pull in Selenium
+        from scraper_interactive import RedHatEventsInteractiveScraper
+        
         # Use Chrome directly (no Edge fallback)
         self.scraper = RedHatEventsInteractiveScraper(
             filters=self.filters, 
@@ -41,27 +54,123 @@ class BatchRunner:
     
         # Store the path for last run data
         self.last_run_file = os.path.join(self.output_dir, "last_run_data.json")
+        
+        # Digest of the events behind the latest exports, used to skip unchanged re-exports
+        self.digest_file = os.path.join(self.output_dir, ".latest_digest")
     
-    def run_once(self, save_excel=True, save_csv=True, export_to_sheets=False):
+    def _read_digest(self):
         """
-        Run the scraper once and process results
-
+        Read the digest of the last exported events
+        
+        Returns:
+            str: Stored digest, or None if not available
+        """
+        try:
+            with open(self.digest_file, 'r', encoding='utf-8') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading export digest: {e}")
+            return None
+    
+    def _write_digest(self, digest):
+        """
+        Store the digest of the exported events
+        
+        Args:
+            digest (str): Digest to store
+        """
+        try:
+            with open(self.digest_file, 'w', encoding='utf-8') as f:
+                f.write(digest)
+        except Exception as e:
+            logger.error(f"Error writing export digest: {e}")
+    
+    def _export_files(self, events, save_excel, save_csv):
+        """
+        Export events to the latest Excel and CSV files, unless they are unchanged
+        
         Args:
+            events (list): Events to export, with 'is_new' flags
             save_excel (bool): Whether to save results to Excel
             save_csv (bool): Whether to save results to CSV
-            export_to_sheets (bool): Whether to export results to Google Sheets (optional)
+        
+        Returns:
+            tuple: (excel_path, csv_path)
+        """
+        latest_excel = os.path.join(self.output_dir, "redhat_events_latest.xlsx")
+        latest_csv = os.path.join(self.output_dir, "redhat_events_latest.csv")
+        
+        # Skip the export entirely when the events match the ones already on disk
+        digest = events_digest(events)
+        unchanged = (
+            digest == self._read_digest()
+            and (not save_excel or os.path.exists(latest_excel))
+            and (not save_csv or os.path.exists(latest_csv))
+        )
+        
+        if unchanged:
+            logger.info("No changes since last export, skipping export")
+            return latest_excel if save_excel else None, latest_csv if save_csv else None
+        
+        # Export to Excel and CSV with fixed filenames, in a single pass over the events
+        excel_path, csv_path = self.processor.export_all(
+            events,
+            excel_filename=latest_excel if save_excel else None,
+            csv_filename=latest_csv if save_csv else None
+        )
+        if excel_path:
+            logger.info(f"Exported all events to {excel_path}")
+        if csv_path:
+            logger.info(f"Exported all events to {csv_path}")
+        
+        # Only remember the digest once every requested export was written to the latest files,
+        # not e.g. to a fallback location, which the next unchanged run wouldn't return
+        if (excel_path == latest_excel or not save_excel) and (csv_path == latest_csv or not save_csv):
+            self._write_digest(digest)
+        
+        return excel_path, csv_path
+    
+    def _export_to_sheets(self, events):
+        """
+        Export events to Google Sheets
+        
+        Args:
+            events (list): Events to export, with 'is_new' flags
+        
+        Returns:
+            str: URL of the Google Sheet, or None on failure
+        """
+        try:
+            sheets_url = self.processor.export_to_google_sheets(events)
+            if sheets_url:
+                logger.info(f"Exported all events to Google Sheets: {sheets_url}")
+            else:
+                logger.warning("Failed to export to Google Sheets")
+            return sheets_url
+        except Exception as e:
+            logger.error(f"Error exporting to Google Sheets: {e}")
+            return None
+    
+    def run_once(self, plan=DEFAULT_EXPORT_PLAN):
+        """
+        Run the scraper once and process results
+
+        Args:
+            plan (ExportPlan): Whether to save results to Excel, to CSV and to Google Sheets
         
         Returns:
             tuple: (all_events, new_events, excel_path, csv_path, sheets_url)
         """
         try:
-            logger.info(f"Starting batch run with filters: {self.filters}")
+            logger.info(f"Starting batch run with filters: {dict(self.filters)}")
             start_time = time.time()
             
-            # Generate timestamp for this session - used for screenshots only now
+            # Generate timestamp for this session - used for screenshots and fallback exports
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            # Pass the timestamp to the scraper for consistent screenshot naming
+            # Pass the timestamp to the scraper for consistent file naming
             self.scraper.session_timestamp = timestamp
     
             # Scrape events
@@ -83,33 +192,18 @@ class BatchRunner:
             sheets_url = None
         
             if all_events:
-                if save_excel:
-                    # Use a fixed filename instead of timestamp
-                    filename = "redhat_events_latest.xlsx"
-
-                    # Export to Excel with fixed filename
-                    excel_path = self.processor.export_to_excel(all_events, filename)
-                    logger.info(f"Exported all events to {excel_path}")
-    
-                # Export to CSV with fixed filename
-                if save_csv:
-                    csv_filename = "redhat_events_latest.csv"
-                    csv_path = self.processor.export_to_csv(all_events, csv_filename)
-                    logger.info(f"Exported all events to {csv_path}")
+                # Local files and the Google Sheets upload are independent, so the upload
+                # runs alongside the Excel/CSV export instead of after it
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    files_future = executor.submit(self._export_files, all_events, plan.excel, plan.csv)
+                    sheets_future = executor.submit(self._export_to_sheets, all_events) if plan.sheets else None
+                    
+                    excel_path, csv_path = files_future.result()
+                    if sheets_future:
+                        sheets_url = sheets_future.result()
                 
                 # Clean up screenshots from previous runs, but keep ones from this run
                 clean_screenshots(self.output_dir, timestamp)
-            
-                # Export to Google Sheets if enabled
-                if export_to_sheets:
-                    try:
-                        sheets_url = self.processor.export_to_google_sheets(all_events)
-                        if sheets_url:
-                            logger.info(f"Exported all events to Google Sheets: {sheets_url}")
-                        else:
-                            logger.warning("Failed to export to Google Sheets")
-                    except Exception as e:
-                        logger.error(f"Error exporting to Google Sheets: {e}")
     
             # Save current data for next run
             save_last_run_data(all_events, self.last_run_file)
@@ -131,16 +225,25 @@ class BatchRunner:
         logger.info(f"Starting continuous batch mode (interval: {self.interval_days} days)")
         
         try:
+            interval_seconds = self.interval_days * 24 * 60 * 60
+            
             while True:
+                # Deadline is taken before the run so scrape time doesn't push the schedule back
+                deadline = time.monotonic() + interval_seconds
+                
                 # Run once
                 all_events, new_events, excel_path, csv_path, sheets_url = self.run_once()
                 
                 # Calculate next run time
-                next_run = datetime.datetime.now() + datetime.timedelta(days=self.interval_days)
+                next_run = datetime.datetime.now() + datetime.timedelta(seconds=max(0, deadline - time.monotonic()))
                 logger.info(f"Next run scheduled for: {next_run}")
                 
-                # Sleep until next run (convert days to seconds)
-                time.sleep(self.interval_days * 24 * 60 * 60)
+                # Sleep in short steps against a monotonic deadline so wall-clock changes
+                # don't affect the wake time and interrupts are handled promptly
+                remaining = deadline - time.monotonic()
+                while remaining > 0:
+                    time.sleep(min(WAKE_CHECK_SECONDS, remaining))
+                    remaining = deadline - time.monotonic()
         
         except KeyboardInterrupt:
             logger.info("Batch mode stopped by user")
@@ -1,5 +1,7 @@
 # Configuration file for RedHat Events Scraper
 # Contains all settings and constants used throughout the application
+import os
+from types import MappingProxyType
 
 # Base URL for RedHat events page
 BASE_URL = "https://www.redhat.com/en/events"
@@ -11,6 +13,17 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
 }
 
+# Address (host:port) of an already running Chrome started with --remote-debugging-port.
+# When set, the scraper attaches to that browser instead of starting its own.
+CHROME_DEBUG_ADDRESS = os.environ.get("CHROME_DEBUG_ADDRESS")
+
+# Skip images and web fonts in the browser. Pages load faster, but screenshots show them
+# without images, so turn this off when debugging with screenshots.
+BLOCK_PAGE_ASSETS = True
+
+# Timeout (seconds) for each results page request
+REQUEST_TIMEOUT = 20
+
 # Output directory for saving scraped data
 OUTPUT_DIR = "output"
 
@@ -20,14 +33,18 @@ DEFAULT_FORMAT = "excel"
 # Batch script configuration
 BATCH_FREQUENCY_DAYS = 7  # Run weekly
 
-# Event filters
-DEFAULT_FILTERS = {
+# Event filters (read-only, so callers can't change the defaults for later runs)
+DEFAULT_FILTERS = MappingProxyType({
     "event_type": "InPerson",
     "region": "North America",
     "date": "Upcoming Events"
-}
+})
 
 # GUI configuration
 GUI_TITLE = "RedHat Events Scraper"
 GUI_WIDTH = 800
-GUI_HEIGHT = 600
\ No newline at end of file
+GUI_HEIGHT = 600
+
+# Log file rotation, so repeated scheduled runs can't grow the logs without bound
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
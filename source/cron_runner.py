@@ -4,26 +4,26 @@
 import sys
 import os
 import logging
-import argparse
 import platform
+from types import SimpleNamespace
 from datetime import datetime
-from batch_script import BatchRunner
+from batch_script import BatchRunner, ExportPlan
 from config import DEFAULT_FILTERS, OUTPUT_DIR
-from utils import ensure_directory
+from utils import configure_logging, configure_debug_mode, ensure_directory
 
-# Configure logging to file in output directory
-ensure_directory(OUTPUT_DIR)
-log_file = os.path.join(OUTPUT_DIR, "cron_scraper.log")
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+def parse_arguments():
+    """Parse command line arguments, without loading argparse for the usual argument-less crontab call"""
+    if len(sys.argv) == 1:
+        return SimpleNamespace(sheets=False, debug=False)
+    
+    import argparse
+    parser = argparse.ArgumentParser(description="RedHat Events Scraper - Cron Runner")
+    parser.add_argument("--sheets", action="store_true", help="Export to Google Sheets")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging and screenshots")
+    return parser.parse_args()
+
 def run_scheduled_scrape(export_sheets=False):
     """
     Run a scheduled scrape with default settings
@@ -49,11 +49,7 @@ def run_scheduled_scrape(export_sheets=False):
         )
         
         # Run scraper once
-        all_events, new_events, excel_path, csv_path, sheets_url = batch_runner.run_once(
-            save_excel=True,
-            save_csv=True,
-            export_to_sheets=export_sheets
-        )
+        all_events, new_events, excel_path, csv_path, sheets_url = batch_runner.run_once(ExportPlan(excel=True, csv=True, sheets=export_sheets))
         
         # Log results
         end_time = datetime.now()
@@ -79,21 +75,23 @@ def run_scheduled_scrape(export_sheets=False):
         return False
 
 if __name__ == "__main__":
+    # Configure logging to file in output directory
+    ensure_directory(OUTPUT_DIR)
+    configure_logging(os.path.join(OUTPUT_DIR, "cron_scraper.log"))
+    
     # Log system information
     logger.info(f"Running on: {platform.system()} {platform.release()} ({platform.version()})")
     logger.info(f"Python version: {platform.python_version()}")
     logger.info(f"Current directory: {os.getcwd()}")
     
     # Parse command line arguments
-    parser = argparse.ArgumentParser(description="RedHat Events Scraper - Cron Runner")
-    parser.add_argument("--sheets", action="store_true", help="Export to Google Sheets")
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    args = parser.parse_args()
+    args = parse_arguments()
     
     # Set debug logging if requested
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
-        logger.info("Debug logging enabled")
+        configure_debug_mode(enable_screenshots=True)
+        logger.info("Debug logging and screenshots enabled")
     
     # Run the scheduled scrape
     success = run_scheduled_scrape(export_sheets=args.sheets)
@@ -1,14 +1,78 @@
 # Data processing module for RedHat Events Scraper
 import os
+import csv
 import logging
 import datetime
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill
+import traceback
+from itertools import islice
 from utils import ensure_directory
 from config import OUTPUT_DIR
 
 logger = logging.getLogger(__name__)
 
+# Columns written to Excel and CSV exports, in order
+EXPORT_HEADERS = [
+    'New', 'Title', 'Location', 'Date Range', 'Start Date', 'End Date',
+    'Link'
+]
+
+# Named styles registered with every exported workbook
+HEADER_STYLE = 'events_header'
+NEW_ROW_STYLE = 'events_new_row'
+NEW_MARKER_STYLE = 'events_new_marker'
+
+# Number of CSV rows written between progress reports
+CSV_PROGRESS_ROWS = 1000
+
+# Write buffer for export files, so rows are flushed in a few large writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+class EventTable:
+    """
+    Column-oriented view of the exported event fields.
+    Each field is read from the event dictionaries once, so every export
+    works on plain lists instead of repeating dict lookups per event.
+    """
+    __slots__ = ('is_new', 'titles', 'locations', 'date_ranges', 'start_dates', 'end_dates', 'links')
+    
+    def __init__(self, events):
+        """
+        Build the columns from a list of events
+        
+        Args:
+            events (list): List of event dictionaries
+        """
+        self.is_new = [event.get('is_new', False) for event in events]
+        self.titles = [event.get('title', 'N/A') for event in events]
+        self.locations = [event.get('location', 'N/A') for event in events]
+        self.date_ranges = [event.get('date_range', 'N/A') for event in events]
+        self.start_dates = [event.get('start_date', '') for event in events]
+        self.end_dates = [event.get('end_date', '') for event in events]
+        self.links = [event.get('link', 'N/A') for event in events]
+    
+    def __len__(self):
+        return len(self.titles)
+    
+    def columns(self):
+        """
+        Get the exported columns, in EXPORT_HEADERS order
+        
+        Returns:
+            list: One list of values per column
+        """
+        new_marks = ["NEW!" if is_new else "" for is_new in self.is_new]
+        return [new_marks, self.titles, self.locations, self.date_ranges,
+                self.start_dates, self.end_dates, self.links]
+    
+    def rows(self):
+        """
+        Iterate over the exported rows, in EXPORT_HEADERS order
+        
+        Returns:
+            iterator: One tuple of values per event
+        """
+        return zip(*self.columns())
+
 class EventDataProcessor:
     def __init__(self, output_dir=OUTPUT_DIR):
         """
@@ -20,207 +84,280 @@ class EventDataProcessor:
         self.output_dir = output_dir
         ensure_directory(output_dir)
     
-    def export_to_excel(self, events, filename=None):
+    def _resolve_filepath(self, filename):
         """
-        Export events to Excel file with improved debugging
+        Resolve an export filename to a full path and make sure its directory exists
+        
+        Args:
+            filename (str): Full path, or bare filename placed in the output directory
+            
+        Returns:
+            str: Full path of the file
+        """
+        # Check if it's a full path or just a filename
+        if os.path.dirname(filename):
+            # It's a full path, use it directly
+            filepath = filename
+            # Ensure the directory exists
+            ensure_directory(os.path.dirname(filepath))
+        else:
+            # It's just a filename, add the output directory
+            filepath = os.path.join(self.output_dir, filename)
+            ensure_directory(self.output_dir)
+        return filepath
+    
+    def _add_named_styles(self, wb):
+        """
+        Register the export styles with a workbook
+        
+        Args:
+            wb (Workbook): Workbook the styles are added to
+        """
+        from openpyxl.styles import Font, Alignment, PatternFill, NamedStyle
+        
+        header_style = NamedStyle(name=HEADER_STYLE)
+        header_style.fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+        header_style.font = Font(color="FFFFFF", bold=True)
+        header_style.alignment = Alignment(horizontal='center')
+        
+        highlight_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Light yellow
+        
+        new_row_style = NamedStyle(name=NEW_ROW_STYLE)
+        new_row_style.fill = highlight_fill
+        
+        new_marker_style = NamedStyle(name=NEW_MARKER_STYLE)
+        new_marker_style.fill = highlight_fill
+        new_marker_style.font = Font(bold=True, color="FF0000")  # Red, bold text
+        
+        for style in (header_style, new_row_style, new_marker_style):
+            wb.add_named_style(style)
     
+    def _build_workbook(self, table):
+        """
+        Build a write-only Excel workbook with styling from an event table
+        
         Args:
-            events (list): List of event dictionaries
-            filename (str): Optional filename, generated if None
+            table (EventTable): Events to write
+            
+        Returns:
+            Workbook: Workbook ready to be saved, a write-only workbook can only be saved once
+        """
+        # openpyxl is only imported once a workbook is written, so importing
+        # this module stays cheap for callers that never export to Excel
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
         
+        columns = table.columns()
+        
+        # Create a write-only workbook, rows are streamed out as they are appended
+        # instead of keeping a Cell object graph for the whole sheet in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("RedHat Events")
+        
+        # Register the styles once with the workbook, cells then refer to them by name
+        self._add_named_styles(wb)
+        
+        # Auto-adjust column width from the widest value of each column
+        # (must be set before the first row is written). Values are almost always
+        # strings already, so str() is only needed for anything else
+        for col_idx, (header, column) in enumerate(zip(EXPORT_HEADERS, columns), 1):
+            width = max([len(header)] + [
+                len(value) if isinstance(value, str) else len(str(value))
+                for value in column if value
+            ])
+            ws.column_dimensions[get_column_letter(col_idx)].width = min((width + 2) * 1.2, 50)
+        
+        # Write headers with styling
+        header_cells = []
+        for header in EXPORT_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = HEADER_STYLE
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # Write data with "New" column and highlighting for new events
+        for is_new, values in zip(table.is_new, zip(*columns)):
+            if not is_new:
+                ws.append(values)
+                continue
+            
+            # Highlight entire row for new events, with a red "NEW!" marker
+            row_cells = []
+            for value in values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = NEW_ROW_STYLE
+                row_cells.append(cell)
+            row_cells[0].style = NEW_MARKER_STYLE
+            ws.append(row_cells)
+        
+        return wb
+    
+    def _save_workbook(self, table, filepath):
+        """
+        Write an event table to an Excel workbook with styling
+        
+        Args:
+            table (EventTable): Events to write
+            filepath (str): Path to save the workbook to
+            
         Returns:
             str: Path to saved file
         """
-        if not events:
-            logger.warning("No events to export")
-            return None
-
+        wb = self._build_workbook(table)
+        
+        # Save the workbook and log success/failure
+        temp_path = filepath + ".tmp"
         try:
-            # Generate filename if not provided
-            if filename is None:
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"redhat_events_all_{timestamp}.xlsx"
-            
-            # Check if it's a full path or just a filename
-            if os.path.dirname(filename):
-                # It's a full path, use it directly
-                filepath = filename
-                # Ensure the directory exists
-                ensure_directory(os.path.dirname(filepath))
-            else:
-                # It's just a filename, add the output directory
-                filepath = os.path.join(self.output_dir, filename)
-                ensure_directory(self.output_dir)
-        
-            # Log the exact path where we're saving
-            logger.info(f"Saving Excel file to: {filepath}")
-        
-            # Create a new workbook and select the active worksheet
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "RedHat Events"
-        
-            # Define headers - WITH New status column
-            headers = [
-                'New', 'Title', 'Location', 'Date Range', 'Start Date', 'End Date',
-                'Link'
-            ]
-        
-            # Write headers with styling
-            header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True)
-        
-            for col_idx, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_idx)
-                cell.value = header
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
-        
-            # Write data with highlighting for new events
-            highlight_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Light yellow
-            new_font = Font(bold=True, color="FF0000")  # Red, bold text
-
-            # Write data with "New" column and highlighting
-            for row_idx, event in enumerate(events, 2):
-                # Check if event is new
-                is_new = event.get('is_new', False)
-                
-                # Add "New" marker column
-                new_cell = ws.cell(row=row_idx, column=1)
-                new_cell.value = "NEW!" if is_new else ""
-                if is_new:
-                    new_cell.font = new_font
-                
-                # Add other columns with offset (column index +1 because of new first column)
-                ws.cell(row=row_idx, column=2).value = event.get('title', 'N/A')
-                ws.cell(row=row_idx, column=3).value = event.get('location', 'N/A')
-                ws.cell(row=row_idx, column=4).value = event.get('date_range', 'N/A')
-                ws.cell(row=row_idx, column=5).value = event.get('start_date', '')
-                ws.cell(row=row_idx, column=6).value = event.get('end_date', '')
-                ws.cell(row=row_idx, column=7).value = event.get('link', 'N/A')
-                
-                # Highlight entire row for new events
-                if is_new:
-                    for col_idx in range(1, len(headers) + 1):
-                        cell = ws.cell(row=row_idx, column=col_idx)
-                        cell.fill = highlight_fill
-        
-            # Auto-adjust column width
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-                adjusted_width = (max_length + 2) * 1.2
-                ws.column_dimensions[column].width = min(adjusted_width, 50)
-        
-            # Save the workbook and log success/failure
+            # Write next to the target and swap it in, so readers never see a missing or partial file
+            with open(temp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                wb.save(f)
+            os.replace(temp_path, filepath)
+            logger.info(f"Successfully saved Excel to: {filepath}")
+            return filepath
+        except Exception as save_error:
+            logger.error(f"Error saving Excel file to {filepath}: {save_error}")
             try:
-                # If file exists, remove it first to ensure clean overwrite
-                if os.path.exists(filepath):
-                    try:
-                        os.remove(filepath)
-                        logger.info(f"Removed existing file at: {filepath}")
-                    except Exception as remove_error:
-                        logger.warning(f"Could not remove existing file at {filepath}: {remove_error}")
-                
-                wb.save(filepath)
-                logger.info(f"Successfully saved Excel to: {filepath}")
-                return filepath
-            except Exception as save_error:
-                logger.error(f"Error saving Excel file to {filepath}: {save_error}")
+                os.remove(temp_path)
+            except OSError:
+                pass
+        
+            # Try saving to current directory as fallback. The write-only workbook
+            # can't be saved twice, so it is built again.
+            fallback_path = os.path.basename(filepath)
+            logger.info(f"Attempting to save to current directory: {fallback_path}")
+            self._build_workbook(table).save(fallback_path)
+            logger.info(f"Saved to fallback location: {fallback_path}")
+            return fallback_path
+    
+    def _save_csv(self, table, filepath, progress=None):
+        """
+        Write an event table to a CSV file
+        
+        Args:
+            table (EventTable): Events to write
+            filepath (str): Path to save the CSV file to
+            progress (callable): Called with the number of rows written, every CSV_PROGRESS_ROWS rows
             
-                # Try saving to current directory as fallback
-                fallback_path = os.path.basename(filepath)
-                logger.info(f"Attempting to save to current directory: {fallback_path}")
-                wb.save(fallback_path)
-                logger.info(f"Saved to fallback location: {fallback_path}")
-                return fallback_path
+        Returns:
+            str: Path to saved file
+        """
+        # Write next to the target and swap it in, so readers never see a missing or partial file
+        temp_path = filepath + ".tmp"
+        try:
+            with open(temp_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(EXPORT_HEADERS)
+                if progress is None:
+                    writer.writerows(table.rows())
+                else:
+                    # Write in chunks so progress is reported per chunk rather than per row
+                    rows = table.rows()
+                    written = 0
+                    chunk = list(islice(rows, CSV_PROGRESS_ROWS))
+                    while chunk:
+                        writer.writerows(chunk)
+                        written += len(chunk)
+                        progress(written)
+                        chunk = list(islice(rows, CSV_PROGRESS_ROWS))
+            os.replace(temp_path, filepath)
+        except Exception:
+            # Don't leave a partial file behind, e.g. when the CSV is open in Excel on Windows
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
         
-        except Exception as e:
-            logger.error(f"Error creating Excel file: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return None
+        logger.info(f"Successfully saved CSV to: {filepath}")
+        return filepath
     
-    def export_to_csv(self, events, filename=None):
+    def export_all(self, events, excel_filename=None, csv_filename=None, progress=None):
         """
-        Export events to CSV file
+        Export events to Excel and/or CSV, reading the events only once
+        
+        Args:
+            events (list): List of event dictionaries
+            excel_filename (str): Excel filename or path, skipped if None
+            csv_filename (str): CSV filename or path, skipped if None
+            progress (callable): Called with the number of CSV rows written so far
+        
+        Returns:
+            tuple: (excel_path, csv_path), None for formats skipped or failed
+        """
+        if not events:
+            logger.warning("No events to export")
+            return None, None
+        
+        # Extract the exported fields once into columns shared by both outputs
+        table = EventTable(events)
+        
+        excel_path = None
+        csv_path = None
+        
+        if excel_filename:
+            try:
+                excel_path = self._resolve_filepath(excel_filename)
+                # Log the exact path where we're saving
+                logger.info(f"Saving Excel file to: {excel_path}")
+                excel_path = self._save_workbook(table, excel_path)
+            except Exception as e:
+                logger.error(f"Error creating Excel file: {e}")
+                logger.error(traceback.format_exc())
+                excel_path = None
+        
+        if csv_filename:
+            try:
+                csv_path = self._resolve_filepath(csv_filename)
+                logger.info(f"Saving CSV file to: {csv_path}")
+                csv_path = self._save_csv(table, csv_path, progress)
+            except Exception as e:
+                logger.error(f"Error creating CSV file: {e}")
+                logger.error(traceback.format_exc())
+                csv_path = None
         
+        return excel_path, csv_path
+    
+    def export_to_excel(self, events, filename=None, timestamp=None):
+        """
+        Export events to Excel file with improved debugging
+    
         Args:
             events (list): List of event dictionaries
             filename (str): Optional filename, generated if None
+            timestamp (str): Timestamp for the generated filename, current time if None
         
         Returns:
             str: Path to saved file
         """
-        import csv
+        # Generate filename if not provided
+        if filename is None:
+            timestamp = timestamp or datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"redhat_events_all_{timestamp}.xlsx"
         
-        if not events:
-            logger.warning("No events to export to CSV")
-            return None
+        excel_path, _ = self.export_all(events, excel_filename=filename)
+        return excel_path
+    
+    def export_to_csv(self, events, filename=None, timestamp=None, progress=None):
+        """
+        Export events to CSV file
         
-        try:
-            # Generate filename if not provided
-            if filename is None:
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"redhat_events_{timestamp}.csv"
-            
-            # Create full path
-            if os.path.dirname(filename):
-                filepath = filename
-                ensure_directory(os.path.dirname(filepath))
-            else:
-                filepath = os.path.join(self.output_dir, filename)
-                ensure_directory(self.output_dir)
-            
-            logger.info(f"Saving CSV file to: {filepath}")
-            
-            # If file exists, remove it first to ensure clean overwrite
-            if os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                    logger.info(f"Removed existing file at: {filepath}")
-                except Exception as remove_error:
-                    logger.warning(f"Could not remove existing file at {filepath}: {remove_error}")
-            
-            # Define headers with "New" column
-            headers = [
-                'New', 'Title', 'Location', 'Date Range', 'Start Date', 'End Date',
-                'Link'
-            ]
-            
-            # Write to CSV
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=headers)
-                writer.writeheader()
-                
-                for event in events:
-                    # Check if event is new
-                    is_new = event.get('is_new', False)
-                    
-                    writer.writerow({
-                        'New': "NEW!" if is_new else "",
-                        'Title': event.get('title', 'N/A'),
-                        'Location': event.get('location', 'N/A'),
-                        'Date Range': event.get('date_range', 'N/A'),
-                        'Start Date': event.get('start_date', ''),
-                        'End Date': event.get('end_date', ''),
-                        'Link': event.get('link', 'N/A')
-                    })
-            
-            logger.info(f"Successfully saved CSV to: {filepath}")
-            return filepath
+        Args:
+            events (list): List of event dictionaries
+            filename (str): Optional filename, generated if None
+            timestamp (str): Timestamp for the generated filename, current time if None
+            progress (callable): Called with the number of rows written, every CSV_PROGRESS_ROWS rows
         
-        except Exception as e:
-            logger.error(f"Error creating CSV file: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return None
+        Returns:
+            str: Path to saved file
+        """
+        # Generate filename if not provided
+        if filename is None:
+            timestamp = timestamp or datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"redhat_events_{timestamp}.csv"
+        
+        _, csv_path = self.export_all(events, csv_filename=filename, progress=progress)
+        return csv_path
     
     def format_for_display(self, events, max_events=10):
         """
@@ -3,7 +3,12 @@ import sys
 import re
 import datetime
 import logging
+import math
 import os
+import platform
+import subprocess
+from collections import namedtuple
+from html import escape
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QComboBox, QCheckBox, 
@@ -11,11 +16,9 @@ from PyQt5.QtWidgets import (
     QProgressBar
 )
 
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer, QRectF, QPointF
-from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QLinearGradient
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer, QElapsedTimer, QRect, QRectF, QPointF
+from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QLinearGradient, QPixmap
 
-from data_processor import EventDataProcessor
-from batch_script import BatchRunner
 from config import DEFAULT_FILTERS, GUI_TITLE, GUI_WIDTH, OUTPUT_DIR
 from utils import ensure_directory
 
@@ -29,23 +32,152 @@ LIGHT_GRAY = "#F5F5F5"
 DARK_GRAY = "#333333"
 SUCCESS_GREEN = "#1ED17E"
 
+# Default location offered by the save dialogs (desktop), resolved once
+DEFAULT_SAVE_DIR = os.path.expanduser("~/Desktop")
+
+# Opener for saved files, resolved once for the current platform
+if platform.system() == 'Windows':
+    open_with_default_app = os.startfile
+else:
+    OPEN_COMMAND = 'open' if platform.system() == 'Darwin' else 'xdg-open'
+    
+    def open_with_default_app(file_path):
+        """Open a file with the default application without waiting for it"""
+        # Detached in its own session with no pipes, so the opener never ties up the GUI process
+        subprocess.Popen([OPEN_COMMAND, file_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         start_new_session=True)
+
+# Summary label stylesheets, with a red marker when new events were found
+SUMMARY_STYLESHEET = """
+    background-color: #1A2C3D;
+    color: white;
+    padding: 10px;
+    border-radius: 4px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-weight: bold;
+"""
+SUMMARY_NEW_STYLESHEET = SUMMARY_STYLESHEET + """    border-left: 5px solid #FF5252;
+"""
+
+# Results view message shown while a scrape is starting, filled in with the selected filters
+STARTING_HTML_TEMPLATE = """
+        <div style="color: #666; margin: 10px;">
+            <h3 style="color: #1A2C3D;">Starting RedHat Events Scraper</h3>
+            <p>Using <b>Selenium</b> with headless browser to interactively browse the RedHat Events website with the following filters:</p>
+            <ul>
+                <li><b>Event Type: {event_type}, Region: {region}, Date: {date}</b></li>
+            </ul>
+            <p>Process steps:</p>
+            <ol>
+                <li>Opening web browser (running in background)</li>
+                <li>Navigating to RedHat Events page</li>
+                <li>Selecting filters</li>
+                <li>Scraping event details</li>
+                <li>Exporting to Excel and CSV</li>
+            </ol>
+            <p><i>Please wait while the browser loads and processes the data. This process takes about 1 minute...</i></p>
+        </div>
+        """
+
+# Global window stylesheet, defined once and shared by every window instance
+MAIN_STYLESHEET = """
+    QMainWindow {
+        background-color: #F8F8F8;
+    }
+    QGroupBox {
+        background-color: white;
+        border: 1px solid #CCCCCC;
+        border-radius: 6px;
+        margin-top: 12px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+        color: #EE0000;
+        font-size: 14px;
+    }
+    QPushButton {
+        background-color: #3AA0FE;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-height: 35px;
+    }
+    QPushButton:hover {
+        background-color: #1E88E5;
+    }
+    QPushButton:pressed {
+        background-color: #0D47A1;
+    }
+    QPushButton:disabled {
+        background-color: #CCCCCC;
+        color: #666666;
+    }
+    QTextEdit {
+        border: 1px solid #CCCCCC;
+        border-radius: 4px;
+        background-color: white;
+        font-family: Arial, sans-serif;
+        padding: 5px;
+    }
+"""
+
+# Results view markup for regular and new events, indexed by the event's is_new flag
+EVENT_CLASSES = ("event", "event event-new")
+NEW_BADGES = ("", '<span class="new-badge">NEW!</span>')
+
 class ProgressAnimation(QWidget):
     """Modern loading animation with a moving ball"""
+    SWEEP_MS = 1000  # Time for the ball to cross the track once
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(40)
         self.setValue(0)
         self.setMinimumWidth(200)
         
+        # paintEvent fills its own background, so Qt can skip clearing the widget first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        
         # Animation configuration
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_position)
-        self.timer.setInterval(20)  # Update every 20ms for smooth animation
+        self.timer.setInterval(33)  # ~30 fps is plenty for a loading indicator
+        self.timer.setTimerType(Qt.CoarseTimer)  # Let Qt coalesce wakeups
         
-        # Animation state
+        # Animation state, position is derived from elapsed time rather than tick count
         self.position = 0
-        self.direction = 1  # 1 = right, -1 = left
         self.running = False
+        self._elapsed = QElapsedTimer()
+        
+        # Paint objects are created once and only repositioned on each frame
+        self._track_gradient = QLinearGradient(0, 0, 1, 0)
+        self._track_gradient.setColorAt(0, QColor(30, 30, 40))
+        self._track_gradient.setColorAt(1, QColor(40, 40, 50))
+        
+        ball_color = QColor(LIGHT_BLUE)
+        self._ball_brush = QBrush(ball_color)
+        self._glow_gradient = QLinearGradient()
+        self._glow_gradient.setColorAt(0, QColor(ball_color.red(), ball_color.green(), ball_color.blue(), 80))
+        self._glow_gradient.setColorAt(1, QColor(ball_color.red(), ball_color.green(), ball_color.blue(), 0))
+        self._highlight_brush = QBrush(QColor(255, 255, 255, 160))
+        
+        self._track_rect = QRectF()
+        
+        # Same colour as the group box the widget sits in
+        self._background_brush = QBrush(Qt.white)
+        
+        # Ball, glow and highlight pre-rendered once, rebuilt when the height changes
+        self._ball_sprite = None
+        self._sprite_padding = 0
+        
+        # Area where the ball was last drawn, repainted when it moves
+        self._painted_ball_rect = QRect()
         
     def setValue(self, value):
         """Set the progress value (0-100)"""
@@ -55,12 +187,16 @@ class ProgressAnimation(QWidget):
     def start_animation(self):
         """Start the animation"""
         self.running = True
-        self.timer.start()
+        self._elapsed.start()
+        # If hidden, the timer is started by showEvent once the widget is shown
+        if self.isVisible():
+            self.timer.start()
         
     def stop_animation(self):
         """Stop the animation"""
         self.running = False
         self.timer.stop()
+        self._painted_ball_rect = QRect()
         self.update()  # Force a final update
     
     def update_position(self):
@@ -68,22 +204,52 @@ class ProgressAnimation(QWidget):
         if not self.running:
             return
             
-        # Update position (oscillate between 0 and 100)
-        self.position += self.direction * 2
-        
-        # Change direction when reaching the ends
-        if self.position >= 100:
-            self.position = 100
-            self.direction = -1
-        elif self.position <= 0:
-            self.position = 0
-            self.direction = 1
-            
-        self.update()
+        # Update position (oscillate between 0 and 100, one sweep every SWEEP_MS)
+        phase = (self._elapsed.elapsed() % (2 * self.SWEEP_MS)) / self.SWEEP_MS
+        self.position = 100 * (phase if phase <= 1 else 2 - phase)
+        
+        # Nothing to repaint while the widget is fully covered
+        if self.visibleRegion().isEmpty():
+            return
+        
+        # Repaint only the strip the ball moved across, the rest of the track is unchanged
+        ball_rect = self._ball_area()
+        self.update(self._painted_ball_rect.united(ball_rect).adjusted(-2, -2, 2, 2))
+        self._painted_ball_rect = ball_rect
+    
+    def _ball_area(self):
+        """Get the widget area covered by the ball and its glow at the current position"""
+        ball_size = self.height() * 0.6 * 0.8
+        glow_size = ball_size * 1.6
+        padding = (glow_size - ball_size) / 2
+        pos_x = (self.width() - ball_size) * (self.position / 100.0)
+        pos_y = self.height() / 2 - ball_size / 2
+        return QRectF(pos_x - padding, pos_y - padding, glow_size, glow_size).toAlignedRect()
+    
+    def showEvent(self, event):
+        """Resume the animation timer when the widget is shown again"""
+        super().showEvent(event)
+        if self.running:
+            self.timer.start()
+    
+    def hideEvent(self, event):
+        """Pause the animation timer while the widget is hidden or minimized"""
+        super().hideEvent(event)
+        self.timer.stop()
+    
+    def handle_application_state(self, state):
+        """Pause the animation timer while the application is hidden or suspended"""
+        if state in (Qt.ApplicationHidden, Qt.ApplicationSuspended):
+            self.timer.stop()
+        elif self.running and self.isVisible():
+            self.timer.start()
         
     def paintEvent(self, event):
         """Draw the animation"""
         painter = QPainter(self)
+        
+        # Clear the dirty area ourselves, the widget is marked opaque
+        painter.fillRect(event.rect(), self._background_brush)
         painter.setRenderHint(QPainter.Antialiasing)
         
         width = self.width()
@@ -91,100 +257,167 @@ class ProgressAnimation(QWidget):
         
         # Draw track background (rounded rectangle)
         track_height = height * 0.6
-        track_rect = QRectF(0, (height - track_height) / 2, width, track_height)
+        self._track_rect.setRect(0, (height - track_height) / 2, width, track_height)
         
-        # Create gradient for the track
-        gradient = QLinearGradient(0, 0, width, 0)
-        gradient.setColorAt(0, QColor(30, 30, 40))
-        gradient.setColorAt(1, QColor(40, 40, 50))
+        # Stretch the track gradient over the current width
+        self._track_gradient.setFinalStop(width, 0)
         
         # Draw track with rounded corners
         painter.setPen(Qt.NoPen)
-        painter.setBrush(gradient)
-        painter.drawRoundedRect(track_rect, track_height / 2, track_height / 2)
+        painter.setBrush(self._track_gradient)
+        painter.drawRoundedRect(self._track_rect, track_height / 2, track_height / 2)
         
         if self.running:
+            if self._ball_sprite is None:
+                self._build_ball_sprite()
+            
             # Calculate ball position
             ball_size = track_height * 0.8
             pos_x = (width - ball_size) * (self.position / 100.0)
             pos_y = height / 2 - ball_size / 2
             
-            # Create a circular gradient for the ball
-            ball_color = QColor(LIGHT_BLUE)
-            
-            # Draw glow effect
-            glow_size = ball_size * 1.6
-            glow_rect = QRectF(
-                pos_x - (glow_size - ball_size) / 2,
-                pos_y - (glow_size - ball_size) / 2,
-                glow_size,
-                glow_size
+            # Blit the pre-rendered ball, offset so the glow is centred on it
+            painter.drawPixmap(
+                QPointF(pos_x - self._sprite_padding, pos_y - self._sprite_padding),
+                self._ball_sprite
             )
-            
-            # Create radial gradient for glow
-            glow_gradient = QLinearGradient(
-                glow_rect.left() + glow_rect.width() / 2,
-                glow_rect.top() + glow_rect.height() / 2,
-                glow_rect.right(),
-                glow_rect.bottom()
-            )
-            glow_gradient.setColorAt(0, QColor(ball_color.red(), ball_color.green(), ball_color.blue(), 80))
-            glow_gradient.setColorAt(1, QColor(ball_color.red(), ball_color.green(), ball_color.blue(), 0))
-            
-            painter.setBrush(glow_gradient)
-            painter.drawEllipse(glow_rect)
-            
-            # Draw the ball
-            ball_rect = QRectF(pos_x, pos_y, ball_size, ball_size)
-            
-            # Main ball
-            painter.setBrush(QBrush(ball_color))
-            painter.drawEllipse(ball_rect)
-            
-            # Highlight on the ball (small white circle)
-            highlight_size = ball_size * 0.3
-            highlight_rect = QRectF(
-                pos_x + ball_size * 0.2,
-                pos_y + ball_size * 0.2,
-                highlight_size,
-                highlight_size
-            )
-            painter.setBrush(QColor(255, 255, 255, 160))
-            painter.drawEllipse(highlight_rect)
+    
+    def resizeEvent(self, event):
+        """Rebuild the ball sprite when the ball size changes"""
+        super().resizeEvent(event)
+        if event.size().height() != event.oldSize().height():
+            self._ball_sprite = None
+    
+    def _build_ball_sprite(self):
+        """Pre-render the ball with its glow and highlight into a pixmap"""
+        ball_size = self.height() * 0.6 * 0.8
+        glow_size = ball_size * 1.6
+        padding = (glow_size - ball_size) / 2
+        
+        # Render at device resolution so the sprite stays sharp on HiDPI screens
+        ratio = self.devicePixelRatioF()
+        side = math.ceil(glow_size * ratio)
+        sprite = QPixmap(side, side)
+        sprite.setDevicePixelRatio(ratio)
+        sprite.fill(Qt.transparent)
+        
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        
+        # Draw glow effect
+        glow_rect = QRectF(0, 0, glow_size, glow_size)
+        self._glow_gradient.setStart(glow_rect.center())
+        self._glow_gradient.setFinalStop(glow_rect.bottomRight())
+        painter.setBrush(self._glow_gradient)
+        painter.drawEllipse(glow_rect)
+        
+        # Main ball
+        painter.setBrush(self._ball_brush)
+        painter.drawEllipse(QRectF(padding, padding, ball_size, ball_size))
+        
+        # Highlight on the ball (small white circle)
+        highlight_size = ball_size * 0.3
+        painter.setBrush(self._highlight_brush)
+        painter.drawEllipse(QRectF(
+            padding + ball_size * 0.2,
+            padding + ball_size * 0.2,
+            highlight_size,
+            highlight_size
+        ))
+        painter.end()
+        
+        self._ball_sprite = sprite
+        self._sprite_padding = padding
 
-class ScraperWorker(QThread):
-    """Worker thread for scraping to avoid freezing the GUI"""
-    finished = pyqtSignal(list, list, str, str, str)  # Updated for 5 parameters
-    error = pyqtSignal(str)
+class SaveSignals(QObject):
+    """Signals emitted by a SaveRunnable"""
+    finished = pyqtSignal(object)  # Saved path, or None if the save failed
+    progress = pyqtSignal(int)  # Rows written so far
+
+class SaveRunnable(QRunnable):
+    """Export events from the thread pool so saving doesn't freeze the GUI"""
+    def __init__(self, export_func, events, file_path, report_progress=False):
+        super().__init__()
+        self.export_func = export_func
+        self.events = events
+        self.file_path = file_path
+        self.report_progress = report_progress
+        self.signals = SaveSignals()
     
+    def run(self):
+        try:
+            if self.report_progress:
+                saved_path = self.export_func(self.events, self.file_path, progress=self.signals.progress.emit)
+            else:
+                saved_path = self.export_func(self.events, self.file_path)
+        except Exception as e:
+            logger.error(f"Error in save worker: {e}")
+            saved_path = None
+        self.signals.finished.emit(saved_path)
+
+# Result of a scrape handed from the worker to the GUI. New events are given as
+# positions in all_events rather than as a second list of the same events
+ScrapeResult = namedtuple('ScrapeResult', ['all_events', 'new_indices', 'excel_path', 'csv_path', 'sheets_url'])
+
+class ScraperSignals(QObject):
+    """Signals emitted by a ScraperWorker"""
+    finished = pyqtSignal(object)  # ScrapeResult, passed by reference instead of converted per element
+    error = pyqtSignal(str)
+
+class ScraperWorker(QRunnable):
+    """Scraping task run on the global thread pool to avoid freezing the GUI"""
     def __init__(self, filters=None, use_headless=True):
         super().__init__()
         self.filters = filters or {}
         self.use_headless = use_headless
+        self.signals = ScraperSignals()
     
     def run(self):
         try:
+            # Imported here so the scraping stack isn't loaded before the window is shown
+            from batch_script import BatchRunner
+            
             # Initialize batch runner with filters
             batch_runner = BatchRunner(filters=self.filters)
             
             # Run once and get results (note the new parameters)
-            all_events, new_events, excel_path, csv_path, sheets_url = batch_runner.run_once(
-                save_excel=True, 
-                save_csv=True, 
-                export_to_sheets=False  # Google Sheets disabled by default
-            )
+            all_events, _, excel_path, csv_path, sheets_url = batch_runner.run_once()  # Excel and CSV, Google Sheets disabled by default
             
-            # Emit results
-            self.finished.emit(all_events, new_events, excel_path, csv_path, sheets_url)
+            # Emit results, new events are flagged with 'is_new' by the batch runner
+            new_indices = [i for i, event in enumerate(all_events) if event.get('is_new')]
+            self.signals.finished.emit(ScrapeResult(all_events, new_indices, excel_path, csv_path, sheets_url))
         
         except Exception as e:
             logger.error(f"Error in scraper worker: {e}")
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+class PreloadRunnable(QRunnable):
+    """Import the browser and Excel libraries the scrape and save paths load lazily"""
+    def run(self):
+        try:
+            import scraper_interactive  # noqa: F401
+            import openpyxl  # noqa: F401
+        except Exception as e:
+            logger.error(f"Error preloading modules: {e}")
 
 class RedHatScraperGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.init_ui()
+        
+        # One processor shared by all manual saves, created on first save
+        self.processor = None
+        
+        # Warm up the deferred imports so the first scrape or save doesn't wait on them
+        QThreadPool.globalInstance().start(PreloadRunnable())
+    
+    def get_processor(self):
+        """Get the shared data processor, importing data_processor on first use"""
+        if self.processor is None:
+            from data_processor import EventDataProcessor
+            self.processor = EventDataProcessor()
+        return self.processor
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -195,52 +428,7 @@ class RedHatScraperGUI(QMainWindow):
         self.setMinimumSize(600, 700)
     
         # Apply global styles 
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #F8F8F8;
-            }
-            QGroupBox {
-                background-color: white;
-                border: 1px solid #CCCCCC;
-                border-radius: 6px;
-                margin-top: 12px;
-                font-weight: bold;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #EE0000;
-                font-size: 14px;
-            }
-            QPushButton {
-                background-color: #3AA0FE;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-height: 35px;
-            }
-            QPushButton:hover {
-                background-color: #1E88E5;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #666666;
-            }
-            QTextEdit {
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                background-color: white;
-                font-family: Arial, sans-serif;
-                padding: 5px;
-            }
-        """)
+        self.setStyleSheet(MAIN_STYLESHEET)
     
         # Central widget
         central_widget = QWidget()
@@ -299,6 +487,14 @@ class RedHatScraperGUI(QMainWindow):
         self.new_events = []
         self.excel_path = None
         self.csv_path = None
+        self.save_task = None
+    
+        # Label updates are coalesced and applied together on a short single-shot timer
+        self._pending_labels = {}
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(16)
+        self._label_timer.timeout.connect(self._flush_labels)
     
         # Make sure output directory exists
         ensure_directory(OUTPUT_DIR)
@@ -312,14 +508,7 @@ class RedHatScraperGUI(QMainWindow):
 
         # Summary in label form
         self.summary_label = QLabel("No data available")
-        self.summary_label.setStyleSheet("""
-            background-color: #1A2C3D;
-            color: white;
-            padding: 10px;
-            border-radius: 4px;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-weight: bold;
-        """)
+        self.summary_label.setStyleSheet(SUMMARY_STYLESHEET)
         self.summary_label.setAlignment(Qt.AlignCenter)
         output_layout.addWidget(self.summary_label)
 
@@ -394,11 +583,8 @@ class RedHatScraperGUI(QMainWindow):
     
     def get_current_filters(self):
         """Get the fixed filters - Always use headless mode"""
-        return {
-            "event_type": "InPerson",
-            "region": "North America",
-            "date": "Upcoming Events"
-        }
+        # The defaults are a read-only mapping, so the same object can be handed out every time
+        return DEFAULT_FILTERS
 
     def create_progress_section(self, parent_layout):
         """Create progress section with custom loading animation"""
@@ -420,6 +606,11 @@ class RedHatScraperGUI(QMainWindow):
         # Improved loading animation widget
         self.loading_animation = ProgressAnimation()
         progress_layout.addWidget(self.loading_animation)
+        
+        # Pause the animation while the application is in the background
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self.loading_animation.handle_application_state)
 
         parent_layout.addWidget(progress_group)
     
@@ -429,10 +620,9 @@ class RedHatScraperGUI(QMainWindow):
         self.scrape_button.setEnabled(False)
         self.save_button.setEnabled(False)
         self.save_csv_button.setEnabled(False)
-        self.status_label.setText("Scraping in progress... (takes about 1 minute)")
-        self.results_text.clear()
-        # Update summary as well
-        self.summary_label.setText("Scraping in progress...")
+        self._set_label_text(self.status_label, "Scraping in progress... (takes about 1 minute)")
+        # Update summary as well (the results text is replaced below, no need to clear it first)
+        self._set_label_text(self.summary_label, "Scraping in progress...")
     
         # Start animation
         self.loading_animation.start_animation()
@@ -441,53 +631,33 @@ class RedHatScraperGUI(QMainWindow):
         filters = self.get_current_filters()
         use_headless = True
     
-        # Display a message mentioning the selected filters
-        filter_description = [
-            f"Event Type: {filters['event_type']}",
-            f"Region: {filters['region']}",
-            f"Date: {filters['date']}"
-        ]
-    
-        filter_text = ", ".join(filter_description)
-    
-        # Set filter explanation
-        self.results_text.setHtml(f"""
-        <div style="color: #666; margin: 10px;">
-            <h3 style="color: #1A2C3D;">Starting RedHat Events Scraper</h3>
-            <p>Using <b>Selenium</b> with headless browser to interactively browse the RedHat Events website with the following filters:</p>
-            <ul>
-                <li><b>{filter_text}</b></li>
-            </ul>
-            <p>Process steps:</p>
-            <ol>
-                <li>Opening web browser (running in background)</li>
-                <li>Navigating to RedHat Events page</li>
-                <li>Selecting filters</li>
-                <li>Scraping event details</li>
-                <li>Exporting to Excel and CSV</li>
-            </ol>
-            <p><i>Please wait while the browser loads and processes the data. This process takes about 1 minute...</i></p>
-        </div>
-        """)
+        # Set filter explanation mentioning the selected filters
+        self.results_text.setHtml(STARTING_HTML_TEMPLATE.format(**filters))
     
-        # Create and start worker thread
+        # Create the worker and run it on the global thread pool, which reuses its threads
         self.worker = ScraperWorker(filters=filters, use_headless=use_headless)
-        self.worker.finished.connect(self.handle_scraping_finished)
-        self.worker.error.connect(self.handle_scraping_error)
-        self.worker.start()
+        self.worker.signals.finished.connect(self.handle_scraping_finished)
+        self.worker.signals.error.connect(self.handle_scraping_error)
+        QThreadPool.globalInstance().start(self.worker)
     
-    def handle_scraping_finished(self, all_events, new_events, excel_path, csv_path=None, sheets_url=None):
+    def handle_scraping_finished(self, result):
         """Handle completion of scraping"""
         # Store results
+        all_events = result.all_events
+        excel_path = result.excel_path
+        csv_path = result.csv_path
         self.all_events = all_events
-        self.new_events = new_events
+        self.new_events = [all_events[i] for i in result.new_indices]
         self.excel_path = excel_path
         self.csv_path = csv_path
     
+        # Check for the Excel file once, the result is used for logging and the status message
+        excel_exists = bool(excel_path) and os.path.exists(excel_path)
+    
         # Debug log
         if excel_path:
             logger.info(f"Excel path received: {excel_path}")
-            if os.path.exists(excel_path):
+            if excel_exists:
                 logger.info(f"Excel file exists at path: {excel_path}")
             else:
                 logger.warning(f"Excel file DOES NOT exist at path: {excel_path}")
@@ -500,79 +670,71 @@ class RedHatScraperGUI(QMainWindow):
         # Stop animation
         self.loading_animation.stop_animation()
 
-        # Display results
+        # Hold repaints while the summary and results are swapped, so they are laid out once
+        self.setUpdatesEnabled(False)
+        try:
+            self.show_results(all_events, excel_path, csv_path, excel_exists)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def show_results(self, all_events, excel_path, csv_path, excel_exists):
+        """Display scraping results in the summary, results view and status label"""
         if all_events:
+            # Format the results with HTML for better presentation, counting new events on the way
+            html_results, new_count = self.format_results_as_html(all_events)
+            
             # Update summary with new events count
             total = len(all_events)
-            new_count = sum(1 for event in all_events if event.get('is_new', False))
 
             if new_count > 0:
-                self.summary_label.setText(f"{total} Events Found ({new_count} new)")
-                self.summary_label.setStyleSheet("""
-                    background-color: #1A2C3D;
-                    color: white;
-                    padding: 10px;
-                    border-radius: 4px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-weight: bold;
-                    border-left: 5px solid #FF5252;
-                """)
+                self._set_label_text(self.summary_label, f"{total} Events Found ({new_count} new)")
             else:
-                self.summary_label.setText(f"{total} Events Found (No new events)")
-                self.summary_label.setStyleSheet("""
-                    background-color: #1A2C3D;
-                    color: white;
-                    padding: 10px;
-                    border-radius: 4px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-weight: bold;
-                """)
-
-            # Format the results with HTML for better presentation
-            html_results = self.format_results_as_html(all_events)
+                self._set_label_text(self.summary_label, f"{total} Events Found (No new events)")
+            
+            # Restyling makes Qt reparse the stylesheet, so only do it when the variant changes
+            summary_style = SUMMARY_NEW_STYLESHEET if new_count > 0 else SUMMARY_STYLESHEET
+            if self.summary_label.styleSheet() != summary_style:
+                self.summary_label.setStyleSheet(summary_style)
+
             self.results_text.setHtml(html_results)
 
             # Update status with more detailed information - IMPROVED MESSAGE
             output_dir_relative = os.path.relpath(OUTPUT_DIR)
-            if excel_path and os.path.exists(excel_path):
+            if excel_exists:
                 excel_filename = os.path.basename(excel_path)
                 csv_filename = os.path.basename(csv_path) if csv_path else "redhat_events_latest.csv"
                 new_events_text = f"{new_count} new events" if new_count > 0 else "no new events"
                 
                 # Improved status message showing both Excel and CSV files
-                self.status_label.setText(
+                self._set_label_text(self.status_label,
                     f"Scraping completed. {total} events found ({new_events_text}). "
                     f"Results automatically saved to {output_dir_relative}/{excel_filename} and {output_dir_relative}/{csv_filename}"
                 )
             else:
                 new_events_text = f"{new_count} new events" if new_count > 0 else "no new events"
-                self.status_label.setText(f"Scraping completed. {total} events found ({new_events_text}). (Excel file not saved)")
+                self._set_label_text(self.status_label, f"Scraping completed. {total} events found ({new_events_text}). (Excel file not saved)")
         else:
-            self.summary_label.setText("No events found")
+            self._set_label_text(self.summary_label, "No events found")
             self.results_text.setHtml("""
                 <div style='text-align: center; margin-top: 50px; color: #666;'>
                     <h3>No events found.</h3>
                     <p>Try changing the filters or check if the RedHat Events page structure has changed.</p>
                 </div>
             """)
-            self.status_label.setText("Scraping completed. No events found.")
+            self._set_label_text(self.status_label, "Scraping completed. No events found.")
     
     def format_results_as_html(self, events):
-        """Format events as HTML for better presentation in QTextEdit"""
+        """
+        Format events as HTML for better presentation in QTextEdit
+        
+        Returns:
+            tuple: (HTML string, number of new events)
+        """
         # Limit the number of events to show initially
         max_display = min(10, len(events))
-        display_events = events[:max_display]
-
-        # Calculate number of events per location and get unique event types
-        event_types = set()
-        for event in events:
-            event_types.add(event.get('type', 'N/A'))
 
-        # Formatted numbers for the summary
-        total_events = len(events)
-        total_types = len(event_types)
-
-        html = f"""
+        # Collect the HTML fragments and join them once at the end
+        parts = [f"""
         <style>
             .locations-box {{
                 padding: 8px 12px;
@@ -636,22 +798,27 @@ class RedHatScraperGUI(QMainWindow):
                 border-radius: 4px;
             }}
         </style>
-        """
+        """]
 
-        # Add individual events - compact version
-        for i, event in enumerate(display_events, 1):
-            event_title = event.get('title', 'N/A')
-            event_date = event.get('date_range', 'N/A')
-            event_location = event.get('location', 'N/A')
+        # Single pass over the events: count the new ones and add the first max_display - compact version
+        new_count = 0
+        for i, event in enumerate(events, 1):
+            is_new = bool(event.get('is_new', False))
+            new_count += is_new
+            if i > max_display:
+                continue
+            
+            # Escape scraped text so stray markup can't break the rich-text layout
+            event_title = escape(event.get('title', 'N/A'))
+            event_date = escape(event.get('date_range', 'N/A'))
+            event_location = escape(event.get('location', 'N/A'))
             event_link = event.get('link', 'N/A')
-            is_new = event.get('is_new', False)
     
-            # Add special class for new events
-            event_class = "event event-new" if is_new else "event"
-            # Add "NEW!" badge if this is a new event
-            new_badge = '<span class="new-badge">NEW!</span>' if is_new else ''
+            # Add special class and "NEW!" badge for new events
+            event_class = EVENT_CLASSES[is_new]
+            new_badge = NEW_BADGES[is_new]
 
-            html += f"""
+            parts.append(f"""
             <div class="{event_class}">
                 <h3>Event {i}: {event_title} {new_badge}</h3>
                 <div class="event-details">
@@ -659,31 +826,31 @@ class RedHatScraperGUI(QMainWindow):
                         <span><strong>Date:</strong> {event_date}</span>
                         <span><strong>Location:</strong> {event_location}</span>
                     </div>
-            """
+            """)
         
             # Link with all necessary properties
             if event_link and event_link != "N/A":
-                html += f"""<p><a href="{event_link}" target="_blank" class="event-link" style="color: #3AA0FE; text-decoration: underline;">View on RedHat.com</a></p>"""
+                parts.append(f"""<p><a href="{escape(event_link)}" target="_blank" class="event-link" style="color: #3AA0FE; text-decoration: underline;">View on RedHat.com</a></p>""")
     
-            html += "</div></div>"
+            parts.append("</div></div>")
 
         # Add a note if there are more events
         if len(events) > max_display:
-            html += f"""
+            parts.append(f"""
             <div class="more-events">
                 + {len(events) - max_display} more events not shown. Check the Excel file for complete results.
             </div>
-            """
+            """)
 
-        return html
+        return "".join(parts), new_count
         
     def handle_scraping_error(self, error_message):
         """Handle scraping error"""
         # Update UI
         self.scrape_button.setEnabled(True)
-        self.status_label.setText(f"Error: {error_message}")
+        self._set_label_text(self.status_label, f"Error: {error_message}")
         self.loading_animation.stop_animation()
-        self.summary_label.setText("Error during scraping")
+        self._set_label_text(self.summary_label, "Error during scraping")
     
         # Show error message using HTML formatting for better visibility
         error_html = f"""
@@ -698,6 +865,11 @@ class RedHatScraperGUI(QMainWindow):
         # Show error message
         QMessageBox.critical(self, "Scraping Error", f"An error occurred during scraping:\n{error_message}")
     
+    def default_save_path(self, extension):
+        """Get the path suggested by the save dialogs, dated today"""
+        today = datetime.date.today().strftime('%Y%m%d')
+        return os.path.join(DEFAULT_SAVE_DIR, f"RedHat_Events_{today}.{extension}")
+    
     def save_to_excel(self):
         """Save current results to Excel at a custom location"""
         if not self.all_events:
@@ -705,9 +877,7 @@ class RedHatScraperGUI(QMainWindow):
             return
 
         # Ask for filename
-        default_dir = os.path.expanduser("~/Desktop")  # Use desktop as default location
-        default_name = f"RedHat_Events_{datetime.datetime.now().strftime('%Y%m%d')}.xlsx"
-        default_path = os.path.join(default_dir, default_name)
+        default_path = self.default_save_path("xlsx")
     
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save Excel As", default_path, "Excel Files (*.xlsx)"
@@ -718,34 +888,21 @@ class RedHatScraperGUI(QMainWindow):
             if not file_path.endswith('.xlsx'):
                 file_path += '.xlsx'
     
-            # Start loading animation
-            self.status_label.setText("Saving Excel file...")
-            self.loading_animation.start_animation()
-    
-            # Save to Excel - pass the complete path
-            processor = EventDataProcessor()
-        
-            # Use the complete path directly (don't extract basename)
-            saved_path = processor.export_to_excel(self.all_events, file_path)
+            # Save to Excel in the background - use the complete path directly (don't extract basename)
+            self.start_save(self.get_processor().export_to_excel, file_path, "Saving Excel file...", self.handle_excel_saved)
     
-            # Stop loading animation
-            self.loading_animation.stop_animation()
+    def handle_excel_saved(self, saved_path):
+        """Handle the end of a background Excel save"""
+        self.finish_save()
     
-            if saved_path:
-                self.status_label.setText(f"Excel file saved to {saved_path}")
-            
-                # Ask if user wants to open the file
-                reply = QMessageBox.question(
-                    self, "File Saved", 
-                    f"Excel file saved successfully to {saved_path}.\nDo you want to open it now?",
-                    QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
-                )
+        if saved_path:
+            self._set_label_text(self.status_label, f"Excel file saved to {saved_path}")
         
-                if reply == QMessageBox.Yes:
-                    self._open_excel_file(saved_path)
-            else:
-                self.status_label.setText("Error saving data to Excel")
-                QMessageBox.warning(self, "Save Error", "Failed to save data to Excel.")
+            # Ask if user wants to open the file
+            self.ask_to_open(saved_path, "Excel")
+        else:
+            self._set_label_text(self.status_label, "Error saving data to Excel")
+            QMessageBox.warning(self, "Save Error", "Failed to save data to Excel.")
 
     def save_to_csv(self):
         """Save current results to CSV at a custom location"""
@@ -754,9 +911,7 @@ class RedHatScraperGUI(QMainWindow):
             return
 
         # Ask for filename
-        default_dir = os.path.expanduser("~/Desktop")  # Use desktop as default location
-        default_name = f"RedHat_Events_{datetime.datetime.now().strftime('%Y%m%d')}.csv"
-        default_path = os.path.join(default_dir, default_name)
+        default_path = self.default_save_path("csv")
 
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save CSV As", default_path, "CSV Files (*.csv)"
@@ -767,34 +922,78 @@ class RedHatScraperGUI(QMainWindow):
             if not file_path.endswith('.csv'):
                 file_path += '.csv'
 
-            # Start loading animation
-            self.status_label.setText("Saving to CSV...")
-            self.loading_animation.start_animation()
+            # Save to CSV in the background - use the complete path directly
+            self.start_save(self.get_processor().export_to_csv, file_path, "Saving to CSV...", self.handle_csv_saved,
+                            report_progress=True)
+    
+    def handle_csv_saved(self, saved_path):
+        """Handle the end of a background CSV save"""
+        self.finish_save()
 
-            # Save to CSV - pass the complete path
-            processor = EventDataProcessor()
+        if saved_path:
+            self._set_label_text(self.status_label, f"CSV file saved to {saved_path}")
         
-            # Use the complete path directly
-            saved_path = processor.export_to_csv(self.all_events, file_path)
-
-            # Stop loading animation
-            self.loading_animation.stop_animation()
-
-            if saved_path:
-                self.status_label.setText(f"CSV file saved to {saved_path}")
-            
-                # Ask if user wants to open the file
-                reply = QMessageBox.question(
-                    self, "File Saved", 
-                    f"CSV file saved successfully to {saved_path}.\nDo you want to open it now?",
-                    QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
-                )
+            # Ask if user wants to open the file
+            self.ask_to_open(saved_path, "CSV")
+        else:
+            self._set_label_text(self.status_label, "Error saving data to CSV")
+            QMessageBox.warning(self, "Save Error", "Failed to save data to CSV.")
+    
+    def start_save(self, export_func, file_path, status_text, on_finished, report_progress=False):
+        """
+        Run an export on the global thread pool
         
-                if reply == QMessageBox.Yes:
-                    self._open_csv_file(saved_path)
-            else:
-                self.status_label.setText("Error saving data to CSV")
-                QMessageBox.warning(self, "Save Error", "Failed to save data to CSV.")
+        Args:
+            export_func (callable): Processor export method, called with (events, file_path)
+            file_path (str): Path to save to
+            status_text (str): Status shown while saving
+            on_finished (callable): Slot receiving the saved path, or None on failure
+            report_progress (bool): Pass a progress callback to export_func and show the rows written
+        """
+        # Block other saves and scrapes until this one is done
+        self.scrape_button.setEnabled(False)
+        self.save_button.setEnabled(False)
+        self.save_csv_button.setEnabled(False)
+        
+        # Start loading animation
+        self._set_label_text(self.status_label, status_text)
+        self.loading_animation.start_animation()
+        
+        # Keep a reference to the task so its signals outlive the call
+        self.save_task = SaveRunnable(export_func, self.all_events, file_path, report_progress)
+        self.save_task.signals.finished.connect(on_finished)
+        self.save_task.signals.progress.connect(self.handle_save_progress)
+        QThreadPool.globalInstance().start(self.save_task)
+    
+    def handle_save_progress(self, rows_written):
+        """Show how many rows a background save has written so far"""
+        self._set_label_text(self.status_label, f"Saving... {rows_written} of {len(self.all_events)} rows written")
+    
+    def ask_to_open(self, saved_path, kind):
+        """Offer to open a saved file in a window-modal box that doesn't block the event loop"""
+        box = QMessageBox(
+            QMessageBox.Question, "File Saved",
+            f"{kind} file saved successfully to {saved_path}.\nDo you want to open it now?",
+            QMessageBox.Yes | QMessageBox.No, self
+        )
+        box.setDefaultButton(QMessageBox.Yes)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda result: self.handle_open_reply(result, saved_path, kind))
+        box.open()
+    
+    def handle_open_reply(self, result, saved_path, kind):
+        """Open the saved file if the user answered yes"""
+        if result == QMessageBox.Yes:
+            self._open_file(saved_path, kind)
+    
+    def finish_save(self):
+        """Restore the UI after a background save"""
+        # Stop loading animation
+        self.loading_animation.stop_animation()
+        self.scrape_button.setEnabled(True)
+        self.save_button.setEnabled(True)
+        self.save_csv_button.setEnabled(True)
+        self.save_task = None
 
     def open_scheduler(self):
         """Open the scheduler configuration dialog"""
@@ -807,47 +1006,26 @@ class RedHatScraperGUI(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open scheduler: {str(e)}")
                 
-    def _open_excel_file(self, file_path):
-        """Open an Excel file with the default application"""
-        try:
-            import platform
-            import subprocess
-        
-            # Use different methods based on operating system
-            system = platform.system()
-        
-            if system == 'Windows':
-                os.startfile(file_path)
-            elif system == 'Darwin':  # macOS
-                subprocess.call(['open', file_path])
-            else:  # Linux and others
-                subprocess.call(['xdg-open', file_path])
-            
-            self.status_label.setText(f"Opening Excel file: {os.path.basename(file_path)}")
-        except Exception as e:
-            self.status_label.setText(f"Error opening Excel file: {str(e)}")
-            QMessageBox.warning(self, "Open Error", f"Could not open the Excel file: {str(e)}")
-            
-    def _open_csv_file(self, file_path):
-        """Open a CSV file with the default application"""
+    def _set_label_text(self, label, text):
+        """Queue a label text change; only the latest text per label is applied"""
+        self._pending_labels[label] = text
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+    
+    def _flush_labels(self):
+        """Apply all queued label text changes"""
+        pending, self._pending_labels = self._pending_labels, {}
+        for label, text in pending.items():
+            label.setText(text)
+    
+    def _open_file(self, file_path, kind):
+        """Open a saved file with the default application"""
         try:
-            import platform
-            import subprocess
-        
-            # Use different methods based on operating system
-            system = platform.system()
-        
-            if system == 'Windows':
-                os.startfile(file_path)
-            elif system == 'Darwin':  # macOS
-                subprocess.call(['open', file_path])
-            else:  # Linux and others
-                subprocess.call(['xdg-open', file_path])
-            
-            self.status_label.setText(f"Opening CSV file: {os.path.basename(file_path)}")
+            open_with_default_app(file_path)
+            self._set_label_text(self.status_label, f"Opening {kind} file: {os.path.basename(file_path)}")
         except Exception as e:
-            self.status_label.setText(f"Error opening CSV file: {str(e)}")
-            QMessageBox.warning(self, "Open Error", f"Could not open the CSV file: {str(e)}")
+            self._set_label_text(self.status_label, f"Error opening {kind} file: {str(e)}")
+            QMessageBox.warning(self, "Open Error", f"Could not open the {kind} file: {str(e)}")
 
 def run_gui():
     """Entry point for GUI"""
@@ -1,22 +1,12 @@
 # Main entry point for RedHat Events Scraper
+import os
 import sys
+import json
 import argparse
 import logging
-from batch_script import BatchRunner
-# from gui import run_gui
 from config import DEFAULT_FILTERS, OUTPUT_DIR
-from utils import ensure_directory
-from scheduler import SchedulerManager
+from utils import configure_logging, ensure_directory
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("redhat_scraper.log"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 def parse_arguments():
@@ -28,6 +18,7 @@ def parse_arguments():
     mode_group.add_argument("--gui", action="store_true", help="Run with graphical user interface")
     mode_group.add_argument("--batch", action="store_true", help="Run in batch mode")
     mode_group.add_argument("--once", action="store_true", help="Run once and exit")
+    mode_group.add_argument("--dump-config", action="store_true", help="Print the scheduler configuration and exit")
     
     # Batch configuration
     parser.add_argument("--interval", type=int, default=7, help="Interval between batch runs (days)")
@@ -45,10 +36,30 @@ def parse_arguments():
     
     return parser.parse_args()
 
+def dump_scheduler_config(output_dir):
+    """Print the scheduler configuration, which is stored compact, in readable form"""
+    from scheduler import CONFIG_FILENAME
+    
+    config_file = os.path.join(output_dir, CONFIG_FILENAME)
+    if not os.path.exists(config_file):
+        print("No scheduler configuration found")
+        return
+    
+    with open(config_file, 'r') as f:
+        print(json.dumps(json.load(f), indent=2))
+
 def main():
     """Main entry point"""
     args = parse_arguments()
     
+    # Only reads the config, so it runs before any logging or directory setup
+    if args.dump_config:
+        dump_scheduler_config(args.output)
+        return
+    
+    # Configured after parsing, so --help doesn't create the log file
+    configure_logging("redhat_scraper.log")
+    
     # Ensure output directory exists
     ensure_directory(args.output)
     
@@ -58,38 +69,31 @@ def main():
     # Determine headless mode
     headless = not args.no_headless
     
-    # Determine export formats
-    save_excel = True  # Always true by default
-    save_csv = True    # Always true by default
-    export_sheets = args.sheets
-    
-    # If specific export formats are specified, only use those
-    if args.excel or args.csv or args.sheets:
-        save_excel = args.excel
-        save_csv = args.csv
-    
-    # Initialize the scheduler (for all modes)
-    scheduler = SchedulerManager(output_dir=args.output)
+    # Determine export formats, Excel and CSV unless specific formats are given
+    explicit = args.excel or args.csv or args.sheets
     
-    # Run in appropriate mode
+    # Run in appropriate mode, importing only what that mode needs
     if args.gui:
         # GUI mode
         logger.info("Starting in GUI mode")
+        from gui import run_gui
         run_gui()
     elif args.batch:
         # Batch mode (continuous)
+        from batch_script import BatchRunner
         logger.info(f"Starting in batch mode (interval: {args.interval} days)")
         batch_runner = BatchRunner(filters=filters, interval_days=args.interval, output_dir=args.output, headless=headless)
         batch_runner.run_continuously()
     else:
         # Single run mode (default)
+        from batch_script import BatchRunner, ExportPlan
         logger.info("Running scraper once")
         batch_runner = BatchRunner(filters=filters, output_dir=args.output, headless=headless)
-        all_events, new_events, excel_path, csv_path, sheets_url = batch_runner.run_once(
-            save_excel=save_excel,
-            save_csv=save_csv,
-            export_to_sheets=export_sheets
-        )
+        all_events, new_events, excel_path, csv_path, sheets_url = batch_runner.run_once(ExportPlan(
+            excel=args.excel if explicit else True,
+            csv=args.csv if explicit else True,
+            sheets=args.sheets
+        ))
         
         # Print summary
         print(f"\nScraping completed:")
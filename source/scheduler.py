@@ -1,29 +1,56 @@
-# scheduler.py - System schedulers only (Windows Task Scheduler and macOS/Linux crontab)
+# scheduler.py - System schedulers only (Windows Task Scheduler, macOS/Linux crontab and Linux systemd user timers)
 import os
 import sys
 import logging
 import json
+import re
 import subprocess
 import platform
+import shutil
 from datetime import datetime
+from functools import lru_cache
 
 from config import OUTPUT_DIR
 from utils import ensure_directory
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for crontab/schtasks/systemctl before giving up
+SUBPROCESS_TIMEOUT = 10
+
+# Platform and scheduler commands, detected once at import without spawning processes
+SYSTEM = platform.system()
+CRONTAB_AVAILABLE = shutil.which('crontab') is not None
+TASK_SCHEDULER_AVAILABLE = SYSTEM == 'Windows' and shutil.which('schtasks') is not None
+
+# A running systemd user manager keeps its runtime directory under XDG_RUNTIME_DIR
+SYSTEMD_AVAILABLE = (
+    SYSTEM == 'Linux'
+    and shutil.which('systemctl') is not None
+    and bool(os.environ.get('XDG_RUNTIME_DIR'))
+    and os.path.isdir(os.path.join(os.environ.get('XDG_RUNTIME_DIR', ''), 'systemd'))
+)
+
+# Directory of the systemd user units created for scheduled jobs
+SYSTEMD_UNIT_DIR = os.path.expanduser('~/.config/systemd/user')
+
+# Scheduler settings file, stored in the output directory
+CONFIG_FILENAME = 'scheduler_config.json'
+
+# Display names of the scheduler backends
+BACKEND_NAMES = {'systemd': 'systemd user timers', 'crontab': 'crontab', 'task_scheduler': 'Windows Task Scheduler'}
+
+# Crontab day-of-week numbers by day name
+CRONTAB_DAYS = {"mon": 1, "tue": 2, "wed": 3, "thu": 4, "fri": 5, "sat": 6, "sun": 0}
+
 def crontab_command_exists():
     """Check if crontab command exists on the system"""
-    try:
-        result = subprocess.run(['which', 'crontab'], capture_output=True, check=False)
-        return result.returncode == 0
-    except Exception:
-        return False
+    return CRONTAB_AVAILABLE
 
 def get_current_crontab():
     """Get current user's crontab"""
     try:
-        result = subprocess.run(['crontab', '-l'], capture_output=True, text=True, check=False)
+        result = subprocess.run(['crontab', '-l'], capture_output=True, text=True, check=False, timeout=SUBPROCESS_TIMEOUT)
         if result.returncode != 0 and "no crontab" not in result.stderr:
             logger.error(f"Error getting crontab: {result.stderr}")
             return ""
@@ -35,10 +62,10 @@ def get_current_crontab():
 def set_crontab(content):
     """Set user's crontab with new content"""
     try:
-        proc = subprocess.Popen(['crontab', '-'], stdin=subprocess.PIPE, text=True)
-        proc.communicate(input=content)
-        if proc.returncode != 0:
-            logger.error(f"Error setting crontab, return code: {proc.returncode}")
+        result = subprocess.run(['crontab', '-'], input=content, capture_output=True, text=True,
+                                check=False, timeout=SUBPROCESS_TIMEOUT)
+        if result.returncode != 0:
+            logger.error(f"Error setting crontab, return code {result.returncode}: {result.stderr}")
             return False
         return True
     except Exception as e:
@@ -50,6 +77,37 @@ def crontab_entry_exists(job_id):
     current = get_current_crontab()
     return f"#{job_id}" in current
 
+def get_crontab_job_ids():
+    """Get the ids of all jobs tagged in user's crontab, read with a single crontab call"""
+    return set(re.findall(r'#(\S+)', get_current_crontab()))
+
+def _rewrite_crontab(job_ids, new_entries=()):
+    """
+    Rewrite user's crontab without the lines tagged with job_ids, using a single read and a single write
+    
+    Args:
+        job_ids (list): Jobs whose existing lines are removed
+        new_entries (list): Lines to append after the remaining lines
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    new_crontab = get_current_crontab()
+    
+    # Drop every whole line carrying one of the exact #job_id tags in one regex pass. Without
+    # job ids the pattern would match every commented line, so nothing is dropped then
+    if job_ids:
+        tags = "|".join(re.escape(job_id) for job_id in job_ids)
+        job_line = re.compile(rf'^.*#(?:{tags})(?!\S).*(?:\n|\Z)', re.MULTILINE)
+        new_crontab = job_line.sub('', new_crontab)
+    if new_crontab and not new_crontab.endswith("\n"):
+        new_crontab += "\n"
+    
+    for entry in new_entries:
+        new_crontab += entry + "\n"
+    
+    return set_crontab(new_crontab)
+
 def add_crontab_job(job_id, schedule, command):
     """
     Add a job to user's crontab
@@ -66,22 +124,8 @@ def add_crontab_job(job_id, schedule, command):
         logger.error("Crontab command not found on this system")
         return False
     
-    # Get current crontab
-    current = get_current_crontab()
-    
-    # Check if job already exists
-    if crontab_entry_exists(job_id):
-        # Remove existing job
-        remove_crontab_job(job_id)
-        # Get updated crontab
-        current = get_current_crontab()
-    
-    # Prepare job entry
-    job_entry = f"{schedule} {command} #{job_id}\n"
-    
-    # Add to crontab
-    new_crontab = current + job_entry
-    return set_crontab(new_crontab)
+    # Replace any existing entry for this job in the same rewrite
+    return _rewrite_crontab([job_id], [f"{schedule} {command} #{job_id}"])
 
 def remove_crontab_job(job_id):
     """Remove a job from user's crontab"""
@@ -89,21 +133,11 @@ def remove_crontab_job(job_id):
         logger.error("Crontab command not found on this system")
         return False
     
-    # Get current crontab
-    current = get_current_crontab()
-    
     # Remove lines containing job_id
-    new_lines = []
-    for line in current.splitlines():
-        if f"#{job_id}" not in line:
-            new_lines.append(line)
-    
-    new_crontab = "\n".join(new_lines)
-    if new_crontab and not new_crontab.endswith("\n"):
-        new_crontab += "\n"
-    
-    return set_crontab(new_crontab)
+    return _rewrite_crontab([job_id])
 
+# Expressions are pure functions of the schedule, so each is built once for the checks and the writes
+@lru_cache(maxsize=32)
 def get_crontab_expression(days_of_week=None, hour=9, minute=0):
     """
     Generate a crontab expression
@@ -118,13 +152,7 @@ def get_crontab_expression(days_of_week=None, hour=9, minute=0):
     """
     if days_of_week:
         # Convert "mon,wed,fri" to "1,3,5"
-        day_map = {"mon": 1, "tue": 2, "wed": 3, "thu": 4, "fri": 5, "sat": 6, "sun": 0}
-        days = []
-        for day in days_of_week.split(","):
-            if day.lower() in day_map:
-                days.append(str(day_map[day.lower()]))
-        
-        day_str = ",".join(days)
+        day_str = ",".join(str(CRONTAB_DAYS[day]) for day in days_of_week.lower().split(",") if day in CRONTAB_DAYS)
         return f"{minute} {hour} * * {day_str}"
     else:
         # Run daily at specified time
@@ -142,19 +170,147 @@ def create_crontab_command():
     # Return the full command
     return f"{python_path} {script_path}"
 
-# Windows Task Scheduler Functions
-def task_scheduler_available():
-    """Check if Windows Task Scheduler is available"""
-    if platform.system() != 'Windows':
+# systemd User Timer Functions
+def systemd_timers_available():
+    """Check if systemd user timers can be used on the system"""
+    return SYSTEMD_AVAILABLE
+
+def run_systemctl(*args):
+    """Run a systemctl --user command, returning True if it succeeded"""
+    try:
+        result = subprocess.run(['systemctl', '--user', *args], capture_output=True, text=True,
+                                check=False, timeout=SUBPROCESS_TIMEOUT)
+        if result.returncode != 0:
+            logger.error(f"Error running systemctl --user {' '.join(args)}: {result.stderr}")
+            return False
+        return True
+    except Exception as e:
+        logger.error(f"Exception running systemctl: {e}")
+        return False
+
+def get_systemd_unit_paths(job_id):
+    """Get the paths of the service and timer units of a job"""
+    unit_path = os.path.join(SYSTEMD_UNIT_DIR, f"redhat-events-scraper-{job_id}")
+    return unit_path + '.service', unit_path + '.timer'
+
+@lru_cache(maxsize=32)
+def get_systemd_calendar(days_of_week=None, hour=9, minute=0):
+    """
+    Generate a systemd OnCalendar expression
+    
+    Args:
+        days_of_week (str): Days of week (e.g., "mon,wed,fri")
+        hour (int): Hour (0-23)
+        minute (int): Minute (0-59)
+        
+    Returns:
+        str: OnCalendar expression
+    """
+    time_str = f"*-*-* {hour:02d}:{minute:02d}:00"
+    if days_of_week:
+        # Convert "mon,wed,fri" to "Mon,Wed,Fri"
+        day_str = ",".join(day.capitalize() for day in days_of_week.lower().split(",") if day in CRONTAB_DAYS)
+        return f"{day_str} {time_str}"
+    else:
+        # Run daily at specified time
+        return time_str
+
+def get_systemd_unit_contents(job_id, calendar, command):
+    """
+    Build the service and timer units of a job
+    
+    Args:
+        job_id (str): Unique identifier for the job
+        calendar (str): OnCalendar expression
+        command (str): Command to run
+        
+    Returns:
+        tuple: Service unit text and timer unit text
+    """
+    # Like cron, the service runs from the home directory; oneshot keeps a run from overlapping the next one
+    service = (
+        '[Unit]\n'
+        f'Description=RedHat Events Scraper ({job_id})\n'
+        '\n'
+        '[Service]\n'
+        'Type=oneshot\n'
+        'WorkingDirectory=%h\n'
+        f'ExecStart={command}\n'
+    )
+    # Persistent makes up a run missed while the computer was off or asleep
+    timer = (
+        '[Unit]\n'
+        f'Description=Schedule of RedHat Events Scraper ({job_id})\n'
+        '\n'
+        '[Timer]\n'
+        f'OnCalendar={calendar}\n'
+        'Persistent=true\n'
+        '\n'
+        '[Install]\n'
+        'WantedBy=timers.target\n'
+    )
+    return service, timer
+
+def add_systemd_timer(job_id, calendar, command):
+    """
+    Install and start a systemd user timer for a job
+    
+    Args:
+        job_id (str): Unique identifier for the job
+        calendar (str): OnCalendar expression (e.g., "Mon *-*-* 09:00:00")
+        command (str): Command to run
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not systemd_timers_available():
+        logger.error("systemd user timers are not available on this system")
         return False
     
     try:
-        # Check if schtasks command is available
-        result = subprocess.run(['where', 'schtasks'], capture_output=True, check=False)
-        return result.returncode == 0
-    except Exception:
+        ensure_directory(SYSTEMD_UNIT_DIR)
+        for path, content in zip(get_systemd_unit_paths(job_id), get_systemd_unit_contents(job_id, calendar, command)):
+            with open(path, 'w') as f:
+                f.write(content)
+    except Exception as e:
+        logger.error(f"Exception writing systemd units: {e}")
+        return False
+    
+    # Reload picks up the new or changed units, enable --now also starts the timer right away
+    timer_name = os.path.basename(get_systemd_unit_paths(job_id)[1])
+    return run_systemctl('daemon-reload') and run_systemctl('enable', '--now', timer_name)
+
+def remove_systemd_timer(job_id):
+    """Stop a job's systemd user timer and remove its units"""
+    if not systemd_timers_available():
+        logger.error("systemd user timers are not available on this system")
+        return False
+    
+    try:
+        service_path, timer_path = get_systemd_unit_paths(job_id)
+        if not os.path.exists(timer_path) and not os.path.exists(service_path):
+            return True
+        
+        # A failed disable is logged, the units are removed regardless so the timer can't come back
+        run_systemctl('disable', '--now', os.path.basename(timer_path))
+        for path in (timer_path, service_path):
+            if os.path.exists(path):
+                os.remove(path)
+        return run_systemctl('daemon-reload')
+    except Exception as e:
+        logger.error(f"Exception removing systemd units: {e}")
         return False
 
+def create_systemd_command():
+    """Create the command that the systemd service will execute"""
+    # ExecStart needs the same quoted absolute paths as the Windows command
+    return create_windows_command()
+
+# Windows Task Scheduler Functions
+def task_scheduler_available():
+    """Check if Windows Task Scheduler is available"""
+    return TASK_SCHEDULER_AVAILABLE
+
 def create_windows_task(task_name, command, schedule_type, interval=None, days=None, hour=None, minute=None):
     """
     Create a scheduled task in Windows Task Scheduler
@@ -188,7 +344,7 @@ def create_windows_task(task_name, command, schedule_type, interval=None, days=N
             cmd.extend(['/D', days])
         
         # Run the command
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=SUBPROCESS_TIMEOUT)
         
         if result.returncode != 0:
             logger.error(f"Error creating Windows scheduled task: {result.stderr}")
@@ -219,14 +375,29 @@ def create_batch_file(command):
     # Create the batch file path
     batch_file = os.path.join(batch_dir, 'run_redhat_scraper.bat')
     
-    # Write the batch file
-    with open(batch_file, 'w') as f:
-        f.write('@echo off\n')
-        f.write(f'cd /d "{script_dir}"\n')
-        f.write(f'{command}\n')
-        f.write('if %ERRORLEVEL% NEQ 0 (\n')
-        f.write(f'  echo Error running RedHat scraper >> "{os.path.join(batch_dir, "error.log")}"\n')
-        f.write(')\n')
+    # Build the batch file contents
+    content = (
+        '@echo off\n'
+        f'cd /d "{script_dir}"\n'
+        f'{command}\n'
+        'if %ERRORLEVEL% NEQ 0 (\n'
+        f'  echo Error running RedHat scraper >> "{os.path.join(batch_dir, "error.log")}"\n'
+        ')\n'
+    )
+    
+    # Leave the file untouched when it already has these contents
+    try:
+        with open(batch_file, 'r') as f:
+            if f.read() == content:
+                return batch_file
+    except OSError:
+        pass
+    
+    # Write the batch file next to the target and swap it in
+    temp_path = batch_file + '.tmp'
+    with open(temp_path, 'w') as f:
+        f.write(content)
+    os.replace(temp_path, batch_file)
     
     return batch_file
 
@@ -242,7 +413,7 @@ def remove_windows_task(task_name):
     """
     try:
         result = subprocess.run(['schtasks', '/Delete', '/F', '/TN', task_name], 
-                               capture_output=True, text=True, check=False)
+                               capture_output=True, text=True, check=False, timeout=SUBPROCESS_TIMEOUT)
         
         if result.returncode != 0 and 'cannot find the file specified' not in result.stderr.lower():
             logger.error(f"Error removing Windows scheduled task: {result.stderr}")
@@ -255,6 +426,24 @@ def remove_windows_task(task_name):
         logger.error(f"Exception removing Windows scheduled task: {e}")
         return False
 
+def windows_task_exists(task_name):
+    """
+    Check if a task is registered with Windows Task Scheduler
+    
+    Args:
+        task_name (str): Name of the task
+        
+    Returns:
+        bool: True if the task exists, False otherwise
+    """
+    try:
+        result = subprocess.run(['schtasks', '/Query', '/TN', task_name],
+                               capture_output=True, text=True, check=False, timeout=SUBPROCESS_TIMEOUT)
+        return result.returncode == 0
+    except Exception as e:
+        logger.error(f"Exception querying Windows scheduled task: {e}")
+        return False
+
 def create_windows_command():
     """Create the command that Windows Task Scheduler will execute"""
     # Get the path to the Python interpreter
@@ -276,23 +465,38 @@ class SchedulerManager:
         ensure_directory(output_dir)
         
         # Configuration file to store scheduler settings
-        self.config_file = os.path.join(output_dir, 'scheduler_config.json')
+        self.config_file = os.path.join(output_dir, CONFIG_FILENAME)
+        
+        # Parsed configuration, read from disk on first use and kept in step by _save_config
+        self._config = None
         
         # Determine if system schedulers are available
-        self.has_crontab = platform.system() in ('Darwin', 'Linux') and crontab_command_exists()
-        self.has_task_scheduler = platform.system() == 'Windows' and task_scheduler_available()
+        self.has_systemd = SYSTEM == 'Linux' and systemd_timers_available()
+        self.has_crontab = SYSTEM in ('Darwin', 'Linux') and crontab_command_exists()
+        self.has_task_scheduler = SYSTEM == 'Windows' and task_scheduler_available()
+        
+        # Scheduler that new jobs go to; on Linux systemd timers are preferred over crontab,
+        # which stays usable to remove jobs scheduled before
+        if self.has_systemd:
+            self.backend = 'systemd'
+        elif self.has_crontab:
+            self.backend = 'crontab'
+        elif self.has_task_scheduler:
+            self.backend = 'task_scheduler'
+        else:
+            self.backend = None
         
-        self.system_scheduler_available = self.has_crontab or self.has_task_scheduler
+        self.system_scheduler_available = self.backend is not None
         
         if not self.system_scheduler_available:
-            logger.warning("No system scheduler available (crontab or Task Scheduler)")
+            logger.warning("No system scheduler available (systemd, crontab or Task Scheduler)")
             
-            if platform.system() == 'Darwin' or platform.system() == 'Linux':
+            if SYSTEM in ('Darwin', 'Linux'):
                 logger.warning("Please make sure crontab is installed and accessible")
-            elif platform.system() == 'Windows':
+            elif SYSTEM == 'Windows':
                 logger.warning("Please ensure Task Scheduler is accessible with current permissions")
         else:
-            logger.info(f"Using system scheduler: {'crontab' if self.has_crontab else 'Windows Task Scheduler'}")
+            logger.info(f"Using system scheduler: {BACKEND_NAMES[self.backend]}")
     
     def schedule_crontab_job(self, job_id, interval_days=None, days_of_week=None, hour=9, minute=0):
         """
@@ -320,26 +524,107 @@ class SchedulerManager:
         if success:
             # Update job info in config
             config = self._load_config()
+            config[job_id] = self._crontab_job_info(interval_days, days_of_week, hour, minute)
+            self._save_config(config)
             
-            # Format description based on schedule type
-            if days_of_week:
-                trigger_desc = f"Weekly on {days_of_week} at {hour:02d}:{minute:02d}"
-            else:
-                trigger_desc = f"Every day at {hour:02d}:{minute:02d}"
+            logger.info(f"Job '{job_id}' scheduled using crontab: {cron_expression}")
+        
+        return success
+    
+    def schedule_crontab_jobs(self, specs):
+        """
+        Schedule several jobs using crontab with a single crontab rewrite and a single config save
+        
+        Args:
+            specs (list): Job dicts with 'job_id' and optional 'interval_days', 'days_of_week', 'hour' and 'minute'
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not specs:
+            return True
+        
+        command = create_crontab_command()
+        
+        entries = []
+        job_infos = {}
+        for spec in specs:
+            job_id = spec['job_id']
+            days_of_week = spec.get('days_of_week')
+            hour = spec.get('hour', 9)
+            minute = spec.get('minute', 0)
             
+            entries.append(f"{get_crontab_expression(days_of_week, hour, minute)} {command} #{job_id}")
+            job_infos[job_id] = self._crontab_job_info(spec.get('interval_days', 7), days_of_week, hour, minute)
+        
+        # Existing entries of all the jobs are replaced in the same rewrite
+        if not _rewrite_crontab(list(job_infos), entries):
+            return False
+        
+        config = self._load_config()
+        config.update(job_infos)
+        self._save_config(config)
+        
+        logger.info(f"Jobs {', '.join(job_infos)} scheduled using crontab")
+        return True
+    
+    def _crontab_job_info(self, interval_days, days_of_week, hour, minute):
+        """Build the saved configuration of a crontab job"""
+        return {
+            'interval_days': interval_days,
+            'days_of_week': days_of_week,
+            'hour': hour,
+            'minute': minute,
+            'trigger_description': self._weekday_trigger_description(days_of_week, hour, minute),
+            'next_run': "Using system crontab",
+            'status': 'Active (crontab)',
+            'is_crontab': True
+        }
+    
+    def _weekday_trigger_description(self, days_of_week, hour, minute):
+        """Describe a schedule that runs daily or on days of the week"""
+        # Format description based on schedule type
+        if days_of_week:
+            return f"Weekly on {days_of_week} at {hour:02d}:{minute:02d}"
+        else:
+            return f"Every day at {hour:02d}:{minute:02d}"
+    
+    def schedule_systemd_timer(self, job_id, interval_days=None, days_of_week=None, hour=9, minute=0):
+        """
+        Schedule a job using a systemd user timer for persistent scheduling
+        
+        Args:
+            job_id (str): Unique identifier for the job
+            interval_days (int): Interval in days (for logging only)
+            days_of_week (str): Days of week (e.g., "mon,wed,fri")
+            hour (int): Hour (0-23)
+            minute (int): Minute (0-59)
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        # Generate OnCalendar expression
+        calendar = get_systemd_calendar(days_of_week, hour, minute)
+        
+        # Install and start the timer
+        success = add_systemd_timer(job_id, calendar, create_systemd_command())
+        
+        if success:
+            # Update job info in config
+            config = self._load_config()
             config[job_id] = {
                 'interval_days': interval_days,
                 'days_of_week': days_of_week,
                 'hour': hour,
                 'minute': minute,
-                'trigger_description': trigger_desc,
-                'next_run': "Using system crontab",
-                'status': 'Active (crontab)',
-                'is_crontab': True
+                'trigger_description': self._weekday_trigger_description(days_of_week, hour, minute),
+                'next_run': "Using systemd user timer",
+                'status': 'Active (systemd timer)',
+                'is_systemd': True
             }
             self._save_config(config)
             
-            logger.info(f"Job '{job_id}' scheduled using crontab: {cron_expression}")
+            logger.info(f"Job '{job_id}' scheduled using systemd timer: {calendar}")
         
         return success
     
@@ -425,18 +710,29 @@ class SchedulerManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Remove existing job with the same ID
-            self.remove_job(job_id)
+            # Nothing to rewrite when the job is already scheduled exactly this way
+            if self._is_scheduled_as(job_id, interval_days, days_of_week, hour, minute):
+                logger.info(f"Job '{job_id}' is already scheduled with these settings")
+                return True
+            
+            # Remove existing job with the same ID; a crontab job is left to the rewrite adding the
+            # new entry, which drops the old line in the same crontab read and write
+            existing = self._load_config().get(job_id, {})
+            if not (existing.get('is_crontab') and self.backend == 'crontab'):
+                self.remove_job(job_id)
             
+            # If a systemd user manager is running on Linux, use its timers for scheduling
+            if self.backend == 'systemd':
+                return self.schedule_systemd_timer(job_id, interval_days, days_of_week, hour, minute)
             # If crontab is available on macOS/Linux, use it for scheduling
-            if self.has_crontab:
+            elif self.backend == 'crontab':
                 return self.schedule_crontab_job(job_id, interval_days, days_of_week, hour, minute)
             # If Windows Task Scheduler is available, use it for scheduling
-            elif self.has_task_scheduler:
+            elif self.backend == 'task_scheduler':
                 return self.schedule_windows_task(job_id, interval_days, days_of_week, hour, minute)
             else:
                 # No system scheduler available
-                error_msg = "No system scheduler available. Please install or enable crontab (macOS/Linux) or ensure Task Scheduler is accessible (Windows)."
+                error_msg = "No system scheduler available. Please install or enable systemd or crontab (macOS/Linux) or ensure Task Scheduler is accessible (Windows)."
                 logger.error(error_msg)
                 return False
                 
@@ -444,6 +740,88 @@ class SchedulerManager:
             logger.error(f"Error scheduling job: {e}")
             return False
     
+    def schedule_jobs(self, specs):
+        """
+        Schedule several scraping jobs at once
+        
+        Args:
+            specs (list): Job dicts with 'job_id' and optional 'interval_days', 'days_of_week', 'hour' and 'minute'
+        
+        Returns:
+            bool: True if all jobs were scheduled, False otherwise
+        """
+        if not specs:
+            return True
+        
+        try:
+            # Crontab jobs are written together in one rewrite
+            if self.backend == 'crontab':
+                return self.schedule_crontab_jobs(specs)
+            
+            # systemd timers and Task Scheduler tasks are created one by one
+            results = [
+                self.schedule_job(spec['job_id'], spec.get('interval_days', 7), spec.get('days_of_week'),
+                                  spec.get('hour', 9), spec.get('minute', 0))
+                for spec in specs
+            ]
+            return all(results)
+        
+        except Exception as e:
+            logger.error(f"Error scheduling jobs: {e}")
+            return False
+    
+    def _is_scheduled_as(self, job_id, interval_days, days_of_week, hour, minute):
+        """
+        Check if a job is already scheduled with the given settings
+        
+        Args:
+            job_id (str): Unique identifier for the job
+            interval_days (int): Interval in days between runs
+            days_of_week (str): Cron-style days of week (e.g., 'mon,wed,fri')
+            hour (int): Hour to run (0-23)
+            minute (int): Minute to run (0-59)
+        
+        Returns:
+            bool: True if the saved job matches and is still registered with the system scheduler
+        """
+        job_config = self._load_config().get(job_id)
+        if not job_config:
+            return False
+        
+        requested = {'interval_days': interval_days, 'days_of_week': days_of_week, 'hour': hour, 'minute': minute}
+        if any(job_config.get(key) != value for key, value in requested.items()):
+            return False
+        
+        if job_config.get('is_crontab'):
+            # The exact entry must still be there, e.g. not pointing at a previous Python interpreter
+            if self.backend != 'crontab':
+                return False
+            expected = f"{get_crontab_expression(days_of_week, hour, minute)} {create_crontab_command()} #{job_id}"
+            return expected in get_current_crontab().splitlines()
+        
+        if job_config.get('is_systemd'):
+            # Both units must still have exactly the contents that would be written now
+            if self.backend != 'systemd':
+                return False
+            expected = get_systemd_unit_contents(job_id, get_systemd_calendar(days_of_week, hour, minute),
+                                                 create_systemd_command())
+            try:
+                for path, content in zip(get_systemd_unit_paths(job_id), expected):
+                    with open(path, 'r') as f:
+                        if f.read() != content:
+                            return False
+            except OSError:
+                return False
+            return True
+        
+        if job_config.get('is_task_scheduler'):
+            # The task may have been deleted in Task Scheduler since it was saved
+            if not self.has_task_scheduler:
+                return False
+            return windows_task_exists(job_config.get('task_name', f"RedHat_Events_Scraper_{job_id}"))
+        
+        return False
+    
     def remove_job(self, job_id):
         """Remove a scheduled job"""
         try:
@@ -464,6 +842,19 @@ class SchedulerManager:
                     
                     return True
             
+            # If systemd timer job, stop the timer and remove its units
+            elif job_config.get('is_systemd', False) and self.has_systemd:
+                success = remove_systemd_timer(job_id)
+                
+                if success:
+                    # Remove from config
+                    if job_id in config:
+                        del config[job_id]
+                        self._save_config(config)
+                        logger.info(f"Job '{job_id}' removed from systemd timers and configuration")
+                    
+                    return True
+            
             # If Windows Task Scheduler job, remove from Task Scheduler
             elif job_config.get('is_task_scheduler', False) and self.has_task_scheduler:
                 task_name = job_config.get('task_name', f"RedHat_Events_Scraper_{job_id}")
@@ -495,6 +886,9 @@ class SchedulerManager:
             # Get saved configuration
             config = self._load_config()
             
+            # Read crontab once for all jobs instead of once per job
+            crontab_job_ids = get_crontab_job_ids() if self.has_crontab else set()
+            
             # Process all jobs from config
             results = {}
             for job_id, job_info in config.items():
@@ -503,10 +897,16 @@ class SchedulerManager:
                 # Add status based on job type
                 if job_info.get('is_crontab'):
                     # For crontab jobs, check if crontab entry exists
-                    if self.has_crontab and crontab_entry_exists(job_id):
+                    if job_id in crontab_job_ids:
                         results[job_id]['status'] = 'Active (crontab)'
                     else:
                         results[job_id]['status'] = 'Inactive (crontab entry not found)'
+                elif job_info.get('is_systemd'):
+                    # For systemd jobs, check if the timer unit exists
+                    if os.path.exists(get_systemd_unit_paths(job_id)[1]):
+                        results[job_id]['status'] = 'Active (systemd timer)'
+                    else:
+                        results[job_id]['status'] = 'Inactive (systemd timer not found)'
                 elif job_info.get('is_task_scheduler'):
                     # For Task Scheduler jobs, we can't easily check if task exists
                     # So we just show it as active based on the config
@@ -523,18 +923,30 @@ class SchedulerManager:
     def _save_config(self, config):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write a temp file and swap it in, so a crash or a concurrent cron run never sees a truncated file
+            temp_path = self.config_file + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(config, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_file)
+            self._config = config
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
+            # Callers edit the cached dict in place, so re-read the file rather than keep unsaved changes
+            self._config = None
     
     def _load_config(self):
-        """Load configuration from file"""
+        """Load configuration from file, parsing it only once per manager"""
+        if self._config is not None:
+            return self._config
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            return {}
+                    self._config = json.load(f)
+            else:
+                self._config = {}
+            return self._config
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             return {}
\ No newline at end of file
@@ -1,23 +1,261 @@
-# scheduler_dialog.py - Updated to use only system schedulers (Windows Task Scheduler or macOS/Linux crontab)
+# scheduler_dialog.py - Updated to use only system schedulers (Windows Task Scheduler, macOS/Linux crontab or Linux systemd timers)
 import sys
-import platform
+import time
+import html
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
-    QLabel, QPushButton, QSpinBox, QComboBox, QTimeEdit, QCheckBox,
+    QLabel, QPushButton, QSpinBox, QComboBox, QCheckBox,
     QMessageBox, QWidget, QFrame
 )
-from PyQt5.QtCore import Qt, QTime
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QFont
 
-from scheduler import SchedulerManager
+from scheduler import SchedulerManager, SYSTEM
+
+# Seconds a loaded job list is reused before the system scheduler is queried again
+JOBS_CACHE_SECONDS = 2.0
+
+# Crontab is used on macOS and Linux, so both share the missing-crontab text
+CRONTAB_MISSING_TEXT = (
+    "System scheduling requires crontab, which was not found on your "
+    "system. Please ensure crontab is installed and accessible to schedule jobs. "
+    "Contact your system administrator if you need assistance installing crontab."
+)
+
+# Info box title, text when the system scheduler is available and text when it isn't,
+# by platform, or 'systemd' when Linux schedules with systemd user timers
+SCHEDULER_INFO = {
+    'Darwin': (
+        "System Scheduling (macOS)",
+        "The scheduler will use macOS crontab for persistent scheduling. "
+        "This means the scraper will run at the scheduled time even if "
+        "the application is closed. Note that your computer must be powered on "
+        "for scheduled tasks to run. The scheduled runs will save results to "
+        "the output directory specified in the configuration.",
+        CRONTAB_MISSING_TEXT
+    ),
+    'Windows': (
+        "System Scheduling (Windows)",
+        "The scheduler will use Windows Task Scheduler for persistent scheduling. "
+        "This means the scraper will run at the scheduled time even if "
+        "the application is closed. Note that your computer must be powered on "
+        "for scheduled tasks to run. The scheduled runs will save results to "
+        "the output directory specified in the configuration.",
+        "System scheduling requires Windows Task Scheduler, which was not found "
+        "or is not accessible. Please ensure you have sufficient permissions to "
+        "create scheduled tasks. Contact your system administrator if you need assistance."
+    ),
+    'Linux': (
+        "System Scheduling (Linux)",
+        "The scheduler will use crontab for persistent scheduling. "
+        "This means the scraper will run at the scheduled time even if "
+        "the application is closed. The scheduled runs will save results to "
+        "the output directory specified in the configuration.",
+        CRONTAB_MISSING_TEXT
+    ),
+    'systemd': (
+        "System Scheduling (Linux, systemd timer)",
+        "The scheduler will use a systemd user timer for persistent scheduling. "
+        "Its timer and service units are written to ~/.config/systemd/user/. "
+        "This means the scraper will run at the scheduled time even if "
+        "the application is closed, and a run missed while the computer was off "
+        "is made up at the next start. The scheduled runs will save results to "
+        "the output directory specified in the configuration.",
+        CRONTAB_MISSING_TEXT
+    ),
+}
+
+# Name of each scheduler backend, for the confirmation message
+SCHEDULER_NAMES = {
+    'systemd': "a systemd user timer",
+    'crontab': "system crontab",
+    'task_scheduler': "Windows Task Scheduler",
+}
+
+# Day checkboxes of the weekly schedule, Monday first
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Stylesheets shared by the dialog's widgets
+GROUPBOX_STYLESHEET = """
+    QGroupBox {
+        font-weight: bold;
+        color: #EE0000;
+        border: 1px solid #CCCCCC;
+        border-radius: 6px;
+        margin-top: 12px;
+        padding: 10px;
+        background-color: white;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+"""
+
+DAYS_GROUP_STYLESHEET = """
+    QGroupBox {
+        font-weight: bold;
+        color: #EE0000;
+        border: 1px solid #DDDDDD;
+        border-radius: 4px;
+        background-color: #F8F8F8;
+        padding: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        margin-left: 8px;
+        padding: 0 5px;
+    }
+    QCheckBox {
+        spacing: 5px;
+    }
+"""
+
+INPUT_STYLESHEET = """
+    QComboBox, QSpinBox {
+        padding: 5px;
+        border: 1px solid #BBBBBB;
+        border-radius: 4px;
+        background-color: white;
+        min-height: 25px;
+    }
+"""
+
+INFO_LABEL_STYLESHEET = """
+    padding: 10px;
+    background-color: #F5F5F5;
+    border: 1px solid #DDDDDD;
+    border-radius: 4px;
+    color: #555555;
+"""
+
+# Status header with and without a scheduled job
+STATUS_IDLE_STYLESHEET = INFO_LABEL_STYLESHEET + """    font-weight: bold;
+"""
+
+STATUS_ACTIVE_STYLESHEET = """
+    padding: 10px;
+    background-color: #E3F2FD;
+    border: 1px solid #90CAF9;
+    border-radius: 4px;
+    color: #1E88E5;
+    font-weight: bold;
+"""
+
+SCHEDULE_BUTTON_STYLESHEET = """
+    QPushButton {
+        background-color: #3AA0FE;
+        color: white;
+        font-weight: bold;
+        padding: 10px 20px;
+        border-radius: 4px;
+        min-width: 150px;
+        min-height: 40px;
+    }
+    QPushButton:hover {
+        background-color: #1E88E5;
+    }
+    QPushButton:pressed {
+        background-color: #0D47A1;
+    }
+"""
+
+REMOVE_BUTTON_STYLESHEET = """
+    QPushButton {
+        background-color: #e74c3c;
+        color: white;
+        font-weight: bold;
+        padding: 10px 20px;
+        border-radius: 4px;
+        min-width: 150px;
+        min-height: 40px;
+    }
+    QPushButton:hover {
+        background-color: #c0392b;
+    }
+    QPushButton:pressed {
+        background-color: #a93226;
+    }
+    QPushButton:disabled {
+        background-color: #CCCCCC;
+        color: #666666;
+    }
+"""
+
+class JobsSignals(QObject):
+    """Signals emitted by a JobsLoader"""
+    finished = pyqtSignal(dict)  # Jobs by job id
+
+class JobsLoader(QRunnable):
+    """Read the scheduled jobs from the thread pool, since that queries the system scheduler"""
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.signals = JobsSignals()
+    
+    def run(self):
+        self.signals.finished.emit(self.scheduler.get_all_jobs())
+
+class ChangeSignals(QObject):
+    """Signals emitted by a ScheduleChange"""
+    finished = pyqtSignal(bool)  # Whether the change succeeded
+
+class ScheduleChange(QRunnable):
+    """Schedule or remove a job from the thread pool, since that runs the system scheduler"""
+    def __init__(self, func, **kwargs):
+        super().__init__()
+        self.func = func
+        self.kwargs = kwargs
+        self.signals = ChangeSignals()
+    
+    def run(self):
+        try:
+            success = self.func(**self.kwargs)
+        except Exception:
+            success = False
+        self.signals.finished.emit(success)
+
+class TwoDigitSpinBox(QSpinBox):
+    """Spin box showing its value with two digits, for hours and minutes"""
+    def textFromValue(self, value):
+        return f"{value:02d}"
 
 class SchedulerDialog(QDialog):
     """Dialog for configuring scheduled scraping jobs"""
     
+    # Status header font, resolved when the first dialog is built and shared by later ones
+    header_font = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scheduler = SchedulerManager()
+        
+        # Loads and changes share the scheduler, so they run one at a time in the order started
+        self.task_pool = QThreadPool(self)
+        self.task_pool.setMaxThreadCount(1)
+        self.jobs_task = None
+        self.change_task = None
+        
+        # Last loaded jobs, dropped whenever a job is scheduled or removed
+        self.jobs_cache = None
+        self.jobs_cache_time = 0.0
+        
+        # Schedule type the inputs are currently set up for
+        self.shown_schedule_type = None
+        
+        # Job state the status labels currently show, None while they show something else
+        self.shown_job_state = None
+        
+        # Message boxes are built on first use and reused for later messages
+        self.confirm_box = None
+        self.message_box = None
+        
         self.init_ui()
+    
+    def showEvent(self, event):
+        """Load the scheduled jobs once the dialog is on screen"""
+        super().showEvent(event)
         self.load_jobs()
     
     def init_ui(self):
@@ -32,22 +270,7 @@ class SchedulerDialog(QDialog):
         
         # Schedule configuration group
         config_group = QGroupBox("Scraping Schedule Configuration")
-        config_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #EE0000;
-                border: 1px solid #CCCCCC;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        config_group.setStyleSheet(GROUPBOX_STYLESHEET)
         config_layout = QFormLayout(config_group)
         config_layout.setVerticalSpacing(12)  # Add more vertical spacing
         
@@ -55,15 +278,7 @@ class SchedulerDialog(QDialog):
         self.schedule_type = QComboBox()
         self.schedule_type.addItem("Run every X days", "interval")
         self.schedule_type.addItem("Run on specific days of week", "weekly")
-        self.schedule_type.setStyleSheet("""
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #BBBBBB;
-                border-radius: 4px;
-                background-color: white;
-                min-height: 25px;
-            }
-        """)
+        self.schedule_type.setStyleSheet(INPUT_STYLESHEET)
         config_layout.addRow("Schedule Type:", self.schedule_type)
         
         # Interval days (for interval schedule)
@@ -71,68 +286,40 @@ class SchedulerDialog(QDialog):
         self.interval_days.setMinimum(1)
         self.interval_days.setMaximum(30)
         self.interval_days.setValue(7)  # Default: 1 week
-        self.interval_days.setStyleSheet("""
-            QSpinBox {
-                padding: 5px;
-                border: 1px solid #BBBBBB;
-                border-radius: 4px;
-                background-color: white;
-                min-height: 25px;
-            }
-        """)
+        self.interval_days.setStyleSheet(INPUT_STYLESHEET)
         config_layout.addRow("Run every X days:", self.interval_days)
         
         # Days of week (for weekly schedule)
         self.days_group = QGroupBox()
         self.days_group.setTitle("Days of week:")
-        self.days_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #EE0000;
-                border: 1px solid #DDDDDD;
-                border-radius: 4px;
-                background-color: #F8F8F8;
-                padding: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                margin-left: 8px;
-                padding: 0 5px;
-            }
-        """)
+        self.days_group.setStyleSheet(DAYS_GROUP_STYLESHEET)
         days_layout = QHBoxLayout(self.days_group)
         days_layout.setContentsMargins(10, 15, 10, 10)
         
-        self.day_checkboxes = {}
-        for day in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]:
-            checkbox = QCheckBox(day)
-            # Default to Monday
-            if day == "Mon":
-                checkbox.setChecked(True)
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    spacing: 5px;
-                }
-            """)
-            self.day_checkboxes[day.lower()] = checkbox
+        # The checkboxes take their spacing from the group's stylesheet
+        self.day_checkboxes = {day.lower(): QCheckBox(day) for day in DAY_NAMES}
+        for checkbox in self.day_checkboxes.values():
             days_layout.addWidget(checkbox)
+        # Default to Monday
+        self.day_checkboxes["mon"].setChecked(True)
         
         config_layout.addRow("", self.days_group)
         
-        # Time to run
-        self.run_time = QTimeEdit()
-        self.run_time.setTime(QTime(9, 0))  # Default: 9:00 AM
-        self.run_time.setDisplayFormat("HH:mm")
-        self.run_time.setStyleSheet("""
-            QTimeEdit {
-                padding: 5px;
-                border: 1px solid #BBBBBB;
-                border-radius: 4px;
-                background-color: white;
-                min-height: 25px;
-            }
-        """)
-        config_layout.addRow("Time to run:", self.run_time)
+        # Time to run, as hour and minute spin boxes
+        self.run_hour = TwoDigitSpinBox()
+        self.run_hour.setRange(0, 23)
+        self.run_hour.setValue(9)  # Default: 9:00 AM
+        self.run_hour.setStyleSheet(INPUT_STYLESHEET)
+        self.run_minute = TwoDigitSpinBox()
+        self.run_minute.setRange(0, 59)
+        self.run_minute.setValue(0)
+        self.run_minute.setStyleSheet(INPUT_STYLESHEET)
+        time_layout = QHBoxLayout()
+        time_layout.addWidget(self.run_hour)
+        time_layout.addWidget(QLabel(":"))
+        time_layout.addWidget(self.run_minute)
+        time_layout.addStretch()
+        config_layout.addRow("Time to run:", time_layout)
         
         # Control buttons - CENTERED
         button_layout = QHBoxLayout()
@@ -140,23 +327,7 @@ class SchedulerDialog(QDialog):
         
         self.schedule_button = QPushButton("Schedule Job")
         self.schedule_button.clicked.connect(self.schedule_job)
-        self.schedule_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3AA0FE;
-                color: white;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 4px;
-                min-width: 150px;
-                min-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #1E88E5;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-        """)
+        self.schedule_button.setStyleSheet(SCHEDULE_BUTTON_STYLESHEET)
         # Add pointing hand cursor
         self.schedule_button.setCursor(Qt.PointingHandCursor)
         
@@ -167,92 +338,24 @@ class SchedulerDialog(QDialog):
         main_layout.addWidget(config_group)
         main_layout.addLayout(button_layout)
         
-        # Add info about system scheduling
-        system_name = platform.system()
-        
         # Check if system scheduler is available
         system_scheduler_available = self.scheduler.system_scheduler_available
         
-        # System scheduler info section
-        if system_name == 'Darwin':  # macOS
-            title = "System Scheduling (macOS)"
-            if system_scheduler_available:
-                info_text = (
-                    "The scheduler will use macOS crontab for persistent scheduling. "
-                    "This means the scraper will run at the scheduled time even if "
-                    "the application is closed. Note that your computer must be powered on "
-                    "for scheduled tasks to run. The scheduled runs will save results to "
-                    "the output directory specified in the configuration."
-                )
-            else:
-                info_text = (
-                    "System scheduling requires crontab, which was not found on your "
-                    "system. Please ensure crontab is installed and accessible to schedule jobs. "
-                    "Contact your system administrator if you need assistance installing crontab."
-                )
-        elif system_name == 'Windows':  # Windows
-            title = "System Scheduling (Windows)"
-            if system_scheduler_available:
-                info_text = (
-                    "The scheduler will use Windows Task Scheduler for persistent scheduling. "
-                    "This means the scraper will run at the scheduled time even if "
-                    "the application is closed. Note that your computer must be powered on "
-                    "for scheduled tasks to run. The scheduled runs will save results to "
-                    "the output directory specified in the configuration."
-                )
-            else:
-                info_text = (
-                    "System scheduling requires Windows Task Scheduler, which was not found "
-                    "or is not accessible. Please ensure you have sufficient permissions to "
-                    "create scheduled tasks. Contact your system administrator if you need assistance."
-                )
-        else:  # Linux or other
-            title = "System Scheduling (Linux)"
-            if system_scheduler_available:
-                info_text = (
-                    "The scheduler will use crontab for persistent scheduling. "
-                    "This means the scraper will run at the scheduled time even if "
-                    "the application is closed. The scheduled runs will save results to "
-                    "the output directory specified in the configuration."
-                )
-            else:
-                info_text = (
-                    "System scheduling requires crontab, which was not found on your "
-                    "system. Please ensure crontab is installed and accessible to schedule jobs. "
-                    "Contact your system administrator if you need assistance installing crontab."
-                )
+        # System scheduler info section, platforms other than macOS and Windows use the Linux text
+        info_key = 'systemd' if self.scheduler.backend == 'systemd' else SYSTEM
+        title, available_text, missing_text = SCHEDULER_INFO.get(info_key, SCHEDULER_INFO['Linux'])
+        info_text = available_text if system_scheduler_available else missing_text
         
         # Create and add the info box
         system_info = QGroupBox(title)
-        system_info.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #EE0000;
-                border: 1px solid #CCCCCC;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        system_info.setStyleSheet(GROUPBOX_STYLESHEET)
         
         system_layout = QVBoxLayout(system_info)
         
         # Add info text
         system_text = QLabel(info_text)
         system_text.setWordWrap(True)
-        system_text.setStyleSheet("""
-            padding: 10px;
-            background-color: #F5F5F5;
-            border: 1px solid #DDDDDD;
-            border-radius: 4px;
-            color: #555555;
-        """)
+        system_text.setStyleSheet(INFO_LABEL_STYLESHEET)
         
         system_layout.addWidget(system_text)
         
@@ -261,22 +364,7 @@ class SchedulerDialog(QDialog):
         
         # Current Schedule - improved status display
         self.status_group = QGroupBox("Current Schedule Status")
-        self.status_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #EE0000;
-                border: 1px solid #CCCCCC;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        self.status_group.setStyleSheet(GROUPBOX_STYLESHEET)
         status_layout = QVBoxLayout(self.status_group)
         status_layout.setSpacing(10)
         
@@ -286,51 +374,18 @@ class SchedulerDialog(QDialog):
         status_container_layout.setContentsMargins(0, 0, 0, 0)
         status_container_layout.setSpacing(8)
         
-        # Status header - always visible
+        # Status header - shows the schedule details below the title when a job is scheduled
         self.status_header = QLabel("No job currently scheduled")
-        self.status_header.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.status_header.setStyleSheet("""
-            padding: 10px;
-            background-color: #F5F5F5;
-            border: 1px solid #DDDDDD;
-            border-radius: 4px;
-            color: #555555;
-        """)
+        self.status_header.setTextFormat(Qt.RichText)
+        if SchedulerDialog.header_font is None:
+            SchedulerDialog.header_font = QFont("Segoe UI", 12, QFont.Bold)
+        self.status_header.setFont(SchedulerDialog.header_font)
+        self.status_header.setStyleSheet(INFO_LABEL_STYLESHEET)
         self.status_header.setAlignment(Qt.AlignCenter)
         self.status_header.setMinimumHeight(40)  # Ensure sufficient height
         self.status_header.setWordWrap(True)  # Allow text wrapping
         status_container_layout.addWidget(self.status_header)
         
-        # Schedule details - hidden when no job
-        self.schedule_details = QLabel("")
-        self.schedule_details.setStyleSheet("""
-            padding: 10px;
-            background-color: #F5F5F5;
-            border: 1px solid #DDDDDD;
-            border-radius: 4px;
-            color: #555555;
-        """)
-        self.schedule_details.setAlignment(Qt.AlignCenter)
-        self.schedule_details.setMinimumHeight(40)  # Ensure sufficient height
-        self.schedule_details.setWordWrap(True)  # Allow text wrapping
-        self.schedule_details.setVisible(False)
-        status_container_layout.addWidget(self.schedule_details)
-        
-        # Next run info - hidden when no job
-        self.next_run_info = QLabel("")
-        self.next_run_info.setStyleSheet("""
-            padding: 10px;
-            background-color: #F5F5F5;
-            border: 1px solid #DDDDDD;
-            border-radius: 4px;
-            color: #555555;
-        """)
-        self.next_run_info.setAlignment(Qt.AlignCenter)
-        self.next_run_info.setMinimumHeight(40)  # Ensure sufficient height
-        self.next_run_info.setWordWrap(True)  # Allow text wrapping
-        self.next_run_info.setVisible(False)
-        status_container_layout.addWidget(self.next_run_info)
-        
         # Add container to status layout
         status_layout.addWidget(self.status_container)
         
@@ -339,27 +394,7 @@ class SchedulerDialog(QDialog):
         remove_layout.addStretch()
         
         self.remove_button = QPushButton("Remove Schedule")
-        self.remove_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 4px;
-                min-width: 150px;
-                min-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #666666;
-            }
-        """)
+        self.remove_button.setStyleSheet(REMOVE_BUTTON_STYLESHEET)
         self.remove_button.setCursor(Qt.PointingHandCursor)
         self.remove_button.clicked.connect(self.remove_job)
         self.remove_button.setEnabled(False)  # Disabled by default
@@ -374,9 +409,9 @@ class SchedulerDialog(QDialog):
         # Add status group to main layout
         main_layout.addWidget(self.status_group)
         
-        # Connect schedule type change to update UI
-        self.schedule_type.currentIndexChanged.connect(self.update_schedule_ui)
+        # Set up the UI for the initial schedule type, then follow changes to it
         self.update_schedule_ui()
+        self.schedule_type.currentIndexChanged.connect(self.update_schedule_ui)
         
         # Disable the schedule button if no system scheduler is available
         if not system_scheduler_available:
@@ -387,30 +422,28 @@ class SchedulerDialog(QDialog):
         """Update UI based on selected schedule type"""
         schedule_type = self.schedule_type.currentData()
         
-        if schedule_type == "interval":
-            self.interval_days.setEnabled(True)
-            self.days_group.setEnabled(False)
-        else:  # weekly
-            self.interval_days.setEnabled(False)
-            self.days_group.setEnabled(True)
+        # Enabling or disabling restyles the whole days group, so only do it when the type changed
+        if schedule_type == self.shown_schedule_type:
+            return
+        self.shown_schedule_type = schedule_type
+        
+        is_interval = schedule_type == "interval"
+        self.interval_days.setEnabled(is_interval)
+        self.days_group.setEnabled(not is_interval)  # weekly
     
     def get_selected_days(self):
         """Get selected days of week as string"""
-        selected_days = []
-        for day, checkbox in self.day_checkboxes.items():
-            if checkbox.isChecked():
-                selected_days.append(day)
-        
-        return ",".join(selected_days) if selected_days else None
+        # Checkboxes were added Monday to Sunday, so the days come out in that order
+        return ",".join(day for day, checkbox in self.day_checkboxes.items() if checkbox.isChecked()) or None
     
     def schedule_job(self):
         """Schedule a new scraping job"""
         try:
             # Check if system scheduler is available
             if not self.scheduler.system_scheduler_available:
-                QMessageBox.warning(self, "System Scheduler Not Available", 
-                                   "No system scheduler (crontab or Task Scheduler) is available. "
-                                   "Please ensure the appropriate scheduler is installed and accessible.")
+                self.show_message(QMessageBox.Warning, "System Scheduler Not Available",
+                                  "No system scheduler (crontab or Task Scheduler) is available. "
+                                  "Please ensure the appropriate scheduler is installed and accessible.")
                 return
             
             # Get schedule type
@@ -425,131 +458,195 @@ class SchedulerDialog(QDialog):
                 days_of_week = self.get_selected_days()
                 
                 if not days_of_week:
-                    QMessageBox.warning(self, "Invalid Schedule", 
-                                       "Please select at least one day of the week.")
+                    self.show_message(QMessageBox.Warning, "Invalid Schedule",
+                                      "Please select at least one day of the week.")
                     return
                 
             # Get time to run
-            time = self.run_time.time()
-            hour = time.hour()
-            minute = time.minute()
+            hour = self.run_hour.value()
+            minute = self.run_minute.value()
             
             # Schedule job
             job_id = "redhat_events_scraper"
-            success = self.scheduler.schedule_job(
+            self.start_change(
+                self.handle_job_scheduled,
+                self.scheduler.schedule_job,
                 job_id=job_id,
                 interval_days=interval_days,
                 days_of_week=days_of_week,
                 hour=hour,
                 minute=minute
             )
+                
+        except Exception as e:
+            self.show_message(QMessageBox.Critical, "Error", f"An error occurred: {e}")
+    
+    def handle_job_scheduled(self, success):
+        """Report the result of scheduling the job"""
+        try:
+            if not self.finish_change():
+                return
             
             if success:
-                # Use the system-appropriate scheduling method
-                system_name = platform.system()
-                
-                if system_name == 'Darwin' or system_name == 'Linux':
-                    scheduler_type = "system crontab"
-                elif system_name == 'Windows':
-                    scheduler_type = "Windows Task Scheduler"
-                else:
-                    scheduler_type = "system scheduler"
-                
                 # Prepare success message
                 message = (
-                    f"The scraping job has been scheduled using {scheduler_type}.\n\n"
+                    f"The scraping job has been scheduled using {SCHEDULER_NAMES.get(self.scheduler.backend, 'system scheduler')}.\n\n"
                     "The scraper will run at the scheduled time even when the application is closed. "
                     "Results will be saved to the output directory."
                 )
                 
-                QMessageBox.information(self, "Job Scheduled", message)
-                self.load_jobs()
+                self.show_message(QMessageBox.Information, "Job Scheduled", message)
             else:
-                QMessageBox.warning(self, "Scheduling Error", 
-                                   "Failed to schedule the scraping job. Please check the logs.")
+                self.show_message(QMessageBox.Warning, "Scheduling Error",
+                                  "Failed to schedule the scraping job. Please check the logs.")
+            
+            # Even a failed attempt may have removed the previous job
+            self.load_jobs()
                 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+            self.show_message(QMessageBox.Critical, "Error", f"An error occurred: {e}")
+    
+    def start_change(self, slot, func, **kwargs):
+        """Run a scheduler change in the background, with the buttons disabled until it is done"""
+        self.schedule_button.setEnabled(False)
+        self.remove_button.setEnabled(False)
+        
+        # A job list still loading was read before the change and is dropped
+        self.jobs_task = None
+        
+        # Keep a reference to the task so its signals outlive the call
+        self.change_task = ScheduleChange(func, **kwargs)
+        self.change_task.signals.finished.connect(slot)
+        self.task_pool.start(self.change_task)
+    
+    def finish_change(self):
+        """Restore the buttons after a scheduler change, returning False for a stale result"""
+        if self.change_task is None or self.sender() is not self.change_task.signals:
+            return False
+        self.change_task = None
+        
+        self.invalidate_jobs()
+        self.schedule_button.setEnabled(self.scheduler.system_scheduler_available)
+        # The remove button is set again from the reloaded jobs, even if the job state is the same
+        self.shown_job_state = None
+        return True
     
     def load_jobs(self):
-        """Load and display current scheduled job"""
+        """Start loading the current scheduled job in the background"""
+        # Jobs read moments ago are still current, e.g. when the dialog is shown again
+        if self.jobs_cache is not None and time.monotonic() - self.jobs_cache_time < JOBS_CACHE_SECONDS:
+            self.show_jobs(self.jobs_cache)
+            return
+        
+        self.status_header.setText("Loading scheduled jobs...")
+        self.shown_job_state = None
+        
+        # Keep a reference to the task so its signals outlive the call
+        self.jobs_task = JobsLoader(self.scheduler)
+        self.jobs_task.signals.finished.connect(self.handle_jobs_loaded)
+        self.task_pool.start(self.jobs_task)
+    
+    def handle_jobs_loaded(self, jobs):
+        """Cache and display the jobs read in the background"""
+        # Results of a load superseded by a later one are dropped
+        if self.jobs_task is None or self.sender() is not self.jobs_task.signals:
+            return
+        self.jobs_task = None
+        
+        self.jobs_cache = jobs
+        self.jobs_cache_time = time.monotonic()
+        self.show_jobs(jobs)
+    
+    def invalidate_jobs(self):
+        """Forget the cached jobs after the schedule changed"""
+        self.jobs_cache = None
+    
+    def show_jobs(self, jobs):
+        """Display the current scheduled job"""
         try:
-            # Get all jobs
-            jobs = self.scheduler.get_all_jobs()
-            
             # Check if redhat_events_scraper job exists
             job_id = "redhat_events_scraper"
+            job_info = jobs.get(job_id, {})
+            
+            # A label already showing this state is left alone, restyling it forces a relayout
+            state = (job_id in jobs, job_info.get('trigger_description'), job_info.get('next_run'))
+            if state == self.shown_job_state:
+                return
+            self.shown_job_state = state
+            
             if job_id in jobs:
-                job_info = jobs[job_id]
-                
-                # Update status header
-                self.status_header.setText("RedHat Events Scraper is scheduled")
-                self.status_header.setStyleSheet("""
-                    padding: 10px;
-                    background-color: #E3F2FD;
-                    border: 1px solid #90CAF9;
-                    border-radius: 4px;
-                    color: #1E88E5;
-                    font-weight: bold;
-                """)
-                
-                # Update and show schedule details
-                schedule_text = job_info.get('trigger_description', 'Unknown schedule')
-                self.schedule_details.setText(f"Schedule: {schedule_text}")
-                self.schedule_details.setVisible(True)
-                
-                # Update and show next run
-                next_run = job_info.get('next_run', 'Unknown')
-                self.next_run_info.setText(f"Next run: {next_run}")
-                self.next_run_info.setVisible(True)
+                # Update status header with the schedule details and next run
+                schedule_text = html.escape(job_info.get('trigger_description', 'Unknown schedule'))
+                next_run = html.escape(job_info.get('next_run', 'Unknown'))
+                self.status_header.setText(
+                    "<div>RedHat Events Scraper is scheduled</div>"
+                    f"<div style='font-weight: normal;'>Schedule: {schedule_text}</div>"
+                    f"<div style='font-weight: normal;'>Next run: {next_run}</div>"
+                )
+                self.status_header.setStyleSheet(STATUS_ACTIVE_STYLESHEET)
                 
                 # Enable remove button
                 self.remove_button.setEnabled(True)
             else:
                 # No job scheduled
                 self.status_header.setText("No job currently scheduled")
-                self.status_header.setStyleSheet("""
-                    padding: 10px;
-                    background-color: #F5F5F5;
-                    border: 1px solid #DDDDDD;
-                    border-radius: 4px;
-                    color: #555555;
-                    font-weight: bold;
-                """)
-                
-                # Hide details
-                self.schedule_details.setVisible(False)
-                self.next_run_info.setVisible(False)
+                self.status_header.setStyleSheet(STATUS_IDLE_STYLESHEET)
                 
                 # Disable remove button
                 self.remove_button.setEnabled(False)
         
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load scheduled jobs: {str(e)}")
+            self.show_message(QMessageBox.Critical, "Error", f"Failed to load scheduled jobs: {e}")
     
     def remove_job(self):
         """Remove the scheduled job"""
         try:
-            reply = QMessageBox.question(
-                self, "Confirm Removal",
-                "Are you sure you want to remove the scheduled job?",
-                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-            )
+            reply = self.get_confirm_box().exec_()
             
             if reply == QMessageBox.Yes:
                 job_id = "redhat_events_scraper"
-                success = self.scheduler.remove_job(job_id)
-                
-                if success:
-                    QMessageBox.information(self, "Job Removed", 
-                                           "The scheduled job has been removed successfully.")
-                    self.load_jobs()
-                else:
-                    QMessageBox.warning(self, "Removal Error", 
-                                       "Failed to remove the job. Please check the logs.")
+                self.start_change(self.handle_job_removed, self.scheduler.remove_job, job_id=job_id)
+        
+        except Exception as e:
+            self.show_message(QMessageBox.Critical, "Error", f"An error occurred: {e}")
+    
+    def handle_job_removed(self, success):
+        """Report the result of removing the job"""
+        try:
+            if not self.finish_change():
+                return
+            
+            if success:
+                self.show_message(QMessageBox.Information, "Job Removed",
+                                  "The scheduled job has been removed successfully.")
+            else:
+                self.show_message(QMessageBox.Warning, "Removal Error",
+                                  "Failed to remove the job. Please check the logs.")
+            
+            self.load_jobs()
         
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+            self.show_message(QMessageBox.Critical, "Error", f"An error occurred: {e}")
+    
+    def get_confirm_box(self):
+        """Get the removal confirmation box, creating it on first use"""
+        if self.confirm_box is None:
+            self.confirm_box = QMessageBox(
+                QMessageBox.Question, "Confirm Removal",
+                "Are you sure you want to remove the scheduled job?",
+                QMessageBox.Yes | QMessageBox.No, self
+            )
+            self.confirm_box.setDefaultButton(QMessageBox.No)
+        return self.confirm_box
+    
+    def show_message(self, icon, title, text):
+        """Show a message in the reused message box"""
+        if self.message_box is None:
+            self.message_box = QMessageBox(self)
+        self.message_box.setIcon(icon)
+        self.message_box.setWindowTitle(title)
+        self.message_box.setText(text)
+        self.message_box.exec_()
     
     def closeEvent(self, event):
         """Handle dialog close event"""
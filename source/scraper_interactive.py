@@ -1,9 +1,16 @@
 # scraper_interactive.py - Uses an interactive approach with filters
+import sys
 import time
 import logging
 import os
 import datetime
 import re
+from urllib.parse import urljoin
+import atexit
+import threading
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -13,12 +20,346 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-from bs4 import BeautifulSoup
-from utils import clean_text, parse_date_range, save_html_for_debugging, ensure_directory
-from config import BASE_URL, HEADERS
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+import utils
+from utils import clean_text, parse_date_range, save_html_for_debugging, ensure_directory, event_fingerprint
+from config import BASE_URL, HEADERS, REQUEST_TIMEOUT, CHROME_DEBUG_ADDRESS, BLOCK_PAGE_ASSETS
+
+try:
+    import requests
+except ImportError:
+    requests = None
 
 logger = logging.getLogger(__name__)
 
+# Event fields whose values repeat across many events (e.g. "Virtual", shared date ranges)
+INTERNED_FIELDS = ('type', 'location', 'date_range', 'start_date', 'end_date', 'action')
+
+# Patterns used by extract_events on every card, compiled once
+EVENT_TYPE_RE = re.compile(r'ONLINE|IN-PERSON|IN PERSON', re.IGNORECASE)
+EVENT_TYPE_ONLY_RE = re.compile(r'^\s*(ONLINE|IN-PERSON|IN PERSON)\s*$', re.IGNORECASE)
+NON_TITLE_RE = re.compile(r'^\s*(ONLINE|IN-PERSON|IN PERSON|WATCH|REGISTER)\s*$', re.IGNORECASE)
+BUTTON_TEXT_RE = re.compile(r'WATCH|LEARN|REGISTER', re.IGNORECASE)
+# Text that resembles a date, as one alternation so each string is scanned once
+DATE_RE = re.compile(
+    r'\w+ \d+, \d{4}'  # January 1, 2025
+    r'|\d{1,2}/\d{1,2}/\d{2,4}'  # 1/1/2025
+    r'|\d{4}-\d{2}-\d{2}'  # 2025-01-01
+)
+
+# CSS selectors extract_events tries in order of preference, compiled once. A comma-joined
+# selector would match in document order instead, so each one is still tried on its own.
+CARD_SELECTORS = [soupsieve.compile(selector) for selector in (
+    # Selectors for filtered event cards
+    'div.rh-card--layout',
+    # Selectors for events on the home page
+    '.pf-v5-c-card',
+    '.pf-c-card',
+    '.card',
+    'div[class*="card"]',
+    'div[class*="event"]',
+    # Other possible selectors
+    '.eventcard',
+    'article.event',
+    '.node--type-event'
+)]
+
+# Returns the HTML of the cards matched by the first of the given selectors that matches,
+# leaving out cards nested in another match (they are part of its HTML), or '' if none do.
+# Only the cards cross the WebDriver connection and get parsed, instead of the whole page.
+CARD_HTML_SCRIPT = """
+for (const selector of arguments[0]) {
+    const cards = Array.from(document.querySelectorAll(selector));
+    if (cards.length) {
+        return cards.filter(card => !(card.parentElement && card.parentElement.closest(selector)))
+            .map(card => card.outerHTML).join('');
+    }
+}
+return '';
+"""
+
+# Every card selector needs a class containing "card" or "event", so only those elements
+# and everything inside them are parsed out of the page
+CARD_STRAINER = SoupStrainer(class_=re.compile(r'card|event'))
+
+TYPE_SELECTORS = [soupsieve.compile(selector) for selector in (
+    '.rh-card-header-title-small',
+    '.card-header',
+    'h4',
+    '.rh-card-header--component h3',
+    # Selectors based on the screenshot
+    '.rh-card-header',
+    'div[class*="card-header"]',
+    'div[class*="header"]'
+)]
+
+TITLE_SELECTORS = [soupsieve.compile(selector) for selector in (
+    '.rh-featured-event-teaser-headline-secondary a',
+    'h2 a',
+    'h3 a',
+    '.card-title a',
+    'a[href*="events"]',
+    # Additional title selectors
+    'h2', 'h3', '.card-title', '.event-title',
+    '[class*="title"]'
+)]
+
+DATE_SELECTORS = [soupsieve.compile(selector) for selector in (
+    '.rh-featured-event-teaser-date-secondary',
+    'time',
+    '.date',
+    '.card-date',
+    # Additional date selectors
+    '[class*="date"]',
+    '[datetime]'
+)]
+
+# Pager links to the next results page, in order of preference
+NEXT_PAGE_SELECTORS = [soupsieve.compile(selector) for selector in (
+    'a[data-testid="pager-next"]',
+    'a[aria-label="Next"]',
+    'a.next'
+)]
+
+# Returns the href of the first enabled link matching one of the given selectors, in
+# order, else of the first enabled link whose text contains "Next", else null
+NEXT_PAGE_SCRIPT = """
+const enabled = link => link.getAttribute('aria-disabled') !== 'true';
+for (const selector of arguments[0]) {
+    const link = Array.from(document.querySelectorAll(selector)).find(enabled);
+    if (link) {
+        return link.href;
+    }
+}
+const link = Array.from(document.querySelectorAll('a')).find(a => a.textContent.includes('Next') && enabled(a));
+return link ? link.href : null;
+"""
+
+ACTION_SELECTORS = [soupsieve.compile(selector) for selector in (
+    '.rh-cta-link',
+    'a.button',
+    '.button',
+    'a.cta',
+    '.cta-link',
+    '[class*="button"]',
+    '[class*="cta"]'
+)]
+
+# Implicit wait of the driver. Kept at 0 so best-effort find_elements scans (filter headers,
+# fallback checkboxes, pager links) return at once when nothing matches; elements that are
+# needed are waited for explicitly. Mixing both kinds of wait makes their timeouts add up.
+IMPLICIT_WAIT_SECONDS = 0
+
+# Option labels the page shows for each event type and date filter value
+EVENT_TYPE_LABELS = {"InPerson": "In-person", "Online": "Online"}
+DATE_LABELS = {"Upcoming Events": "Upcoming events", "Previous Events": "Previous events"}
+
+# Chrome preferences that skip what the scraper never reads, and the ones added when
+# BLOCK_PAGE_ASSETS is on
+BROWSER_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+}
+BLOCKED_ASSET_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
+
+# Requests blocked in the browser when BLOCK_PAGE_ASSETS is on, images and web fonts
+# aren't needed to read the listing
+BLOCKED_URL_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.woff', '*.woff2', '*.ttf']
+
+# Seconds between checks of an explicit wait. Selenium's default of 0.5 s can leave a
+# page that is ready in 100 ms waiting for most of a poll interval.
+WAIT_POLL_SECONDS = 0.1
+
+# Retries of a results page fetched over HTTP that failed with a server error, and the
+# delay before the first retry (doubled for each one after it)
+RESULTS_PAGE_RETRIES = 2
+RESULTS_PAGE_RETRY_DELAY = 0.5
+
+# Seconds to wait for the label of a filter option to render before falling back
+FILTER_WAIT_SECONDS = 5
+
+# Seconds the listing may take to re-render after a filter option is clicked
+FILTER_RESULTS_WAIT_SECONDS = 2
+
+# Seconds the browser may take to apply all filters, including the waits between clicks
+FILTER_SCRIPT_TIMEOUT = 60
+
+# Applies the filter steps in the page, so a filter costs one WebDriver command instead of
+# one per header, label, checkbox and state check. For each step it expands the section
+# header, waits for the option labels to show, and clicks the input each label points to
+# unless it is already checked (or the label itself when it has no input), then waits
+# until the first result card is replaced. Without labels it falls back to the first
+# input whose parent text mentions the option. Every wait polls for its condition instead
+# of pausing for a fixed time. Resolves with the log messages of what was done.
+APPLY_FILTERS_SCRIPT = """
+const [steps, labelWaitMs, resultsWaitMs, done] = arguments;
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+const waitFor = async (condition, timeoutMs) => {
+    for (let waited = 0; !condition() && waited < timeoutMs; waited += 100) {
+        await sleep(100);
+    }
+};
+const findAll = xpath => {
+    const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+};
+const visible = element => element.getClientRects().length > 0;
+const click = async element => {
+    element.scrollIntoView({block: 'center'});
+    await new Promise(requestAnimationFrame);
+    element.click();
+};
+(async () => {
+    const log = [];
+    for (const step of steps) {
+        const header = findAll(step.header_xpath)[0];
+        if (header) {
+            log.push(`Clicking ${step.name} header`);
+            await click(header);
+        }
+        await waitFor(() => findAll(step.label_xpath).some(visible), labelWaitMs);
+        const labels = findAll(step.label_xpath);
+        if (labels.length) {
+            log.push(`Found ${labels.length} ${step.text} labels`);
+            const firstCard = document.querySelector('.rh-card--layout');
+            let clicked = false;
+            for (const label of labels) {
+                const inputId = label.getAttribute('for');
+                const input = inputId ? document.getElementById(inputId) : null;
+                if (input && input.checked) {
+                    log.push(`${step.text} ${step.kind} is already selected`);
+                } else if (input) {
+                    log.push(`Clicking ${step.text} ${step.kind} with ID: ${inputId}`);
+                    await click(input);
+                    clicked = true;
+                } else {
+                    log.push(`Clicking ${step.text} label directly`);
+                    await click(label);
+                    clicked = true;
+                }
+            }
+            if (clicked) {
+                await waitFor(() => document.querySelector('.rh-card--layout') !== firstCard, resultsWaitMs);
+            }
+        } else {
+            const text = step.text.toLowerCase();
+            const inputs = Array.from(document.querySelectorAll(step.input_selector));
+            const index = inputs.findIndex(input => {
+                const parent = input.parentNode;
+                return parent && (parent.innerText || parent.textContent || '').toLowerCase().includes(text);
+            });
+            if (index >= 0) {
+                log.push(`Found ${step.text} ${step.kind} using parent text, index: ${index}`);
+                await click(inputs[index]);
+            }
+        }
+    }
+    return log;
+})().then(done, error => done([`Error applying filters in page: ${error}`]));
+"""
+
+@lru_cache(maxsize=32)
+def get_filter_step(name, text, kind):
+    """
+    Describe one filter for APPLY_FILTERS_SCRIPT, built once per distinct filter
+    
+    Args:
+        name (str): Text of the filter section header
+        text (str): Label text of the option to select
+        kind (str): Input type of the option ("checkbox" or "radio")
+        
+    Returns:
+        dict: Section name, header and label XPaths, option text, input kind and
+              fallback input selector
+    """
+    return {
+        'name': name,
+        'header_xpath': f"//span[text()='{name}']",
+        'label_xpath': f"//label[contains(text(), '{text}')]",
+        'text': text,
+        'kind': kind,
+        'input_selector': f"input[type='{kind}']",
+    }
+
+# Browsers left open by finished scrapes, keyed on (browser type, headless). Starting Chrome
+# takes seconds, so repeated scrapes in one process (the GUI) reuse an idle one instead.
+MAX_IDLE_DRIVERS = 2
+_idle_drivers = {}
+_idle_drivers_lock = threading.Lock()
+
+def quit_driver(driver):
+    """
+    Close a browser, with short timeouts so a hung browser doesn't block
+    
+    Args:
+        driver (WebDriver): Driver to quit
+    """
+    try:
+        driver.set_page_load_timeout(10)
+        driver.set_script_timeout(10)
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error while closing browser: {e}")
+
+def acquire_driver(key):
+    """
+    Take an idle browser left by an earlier scrape
+    
+    Args:
+        key (tuple): Browser type and headless flag the driver was set up with
+        
+    Returns:
+        WebDriver or None: A responsive driver, or None if there is none to reuse
+    """
+    while True:
+        with _idle_drivers_lock:
+            drivers = _idle_drivers.get(key)
+            if not drivers:
+                return None
+            driver = drivers.pop()
+        try:
+            # Check the browser is still alive before handing it out
+            driver.current_url
+            return driver
+        except Exception as e:
+            logger.warning(f"Discarding unresponsive browser: {e}")
+            quit_driver(driver)
+
+def release_driver(key, driver):
+    """
+    Keep a browser open for the next scrape, after clearing its session
+    
+    Args:
+        key (tuple): Browser type and headless flag the driver was set up with
+        driver (WebDriver): Driver of a finished scrape
+        
+    Returns:
+        bool: True if the driver was kept, False if the caller should quit it
+    """
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception as e:
+        logger.warning(f"Could not reset browser for reuse: {e}")
+        return False
+    with _idle_drivers_lock:
+        drivers = _idle_drivers.setdefault(key, [])
+        if len(drivers) >= MAX_IDLE_DRIVERS:
+            return False
+        drivers.append(driver)
+    return True
+
+@atexit.register
+def quit_idle_drivers():
+    """Close every idle browser, run when the process exits"""
+    with _idle_drivers_lock:
+        drivers = [driver for idle in _idle_drivers.values() for driver in idle]
+        _idle_drivers.clear()
+    for driver in drivers:
+        quit_driver(driver)
+
 class RedHatEventsInteractiveScraper:
     def __init__(self, filters=None, headless=True, browser_type="chrome", processor=None, output_dir="output"):
         """
@@ -38,11 +379,34 @@ class RedHatEventsInteractiveScraper:
         self.driver = None
         self.processor = processor
         self.output_dir = output_dir
+        # Timestamp shared by files from one run, set by the batch runner
+        self.session_timestamp = None
+        # Writes screenshot files in the background while scraping, set up by scrape()
+        self.screenshot_executor = None
+        # Whether the driver is attached to a long-lived browser at CHROME_DEBUG_ADDRESS
+        self.attached = False
         ensure_directory(output_dir)
     
+    def _timestamp(self):
+        """Get the session timestamp, or the current time if no session is set"""
+        return self.session_timestamp or datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    
     def setup_driver(self):
         """Set up WebDriver (Chrome) with platform-specific configuration and headless option"""
         try:
+            # Attach to a browser that is already running, so it isn't started for every run
+            if CHROME_DEBUG_ADDRESS:
+                try:
+                    logger.info(f"Attaching to running Chrome at {CHROME_DEBUG_ADDRESS}")
+                    options = ChromeOptions()
+                    options.debugger_address = CHROME_DEBUG_ADDRESS
+                    driver = webdriver.Chrome(options=options)
+                    self.attached = True
+                    return self._prepare_driver(driver)
+                except Exception as attach_error:
+                    logger.warning(f"Could not attach to Chrome at {CHROME_DEBUG_ADDRESS}: {attach_error}")
+                    # Fall through to starting a browser
+            
             # Use headless mode by default (unless specified otherwise)
             use_headless = self.headless
         
@@ -56,6 +420,7 @@ class RedHatEventsInteractiveScraper:
             if use_headless:
                 options.add_argument("--headless=new")  # Modern headless mode
             options.add_argument("--window-size=1920,1080")
+            self._add_load_options(options)
         
             # Some options are problematic on Mac, so only add them on Windows/Linux
             if system != "Darwin":  # Darwin is macOS
@@ -74,8 +439,7 @@ class RedHatEventsInteractiveScraper:
                     logger.info("Trying direct Chrome initialization on macOS")
                     driver = webdriver.Chrome(options=options)
                     logger.info("macOS Chrome initialization successful")
-                    driver.implicitly_wait(10)
-                    return driver
+                    return self._prepare_driver(driver)
                 except Exception as mac_error:
                     logger.warning(f"Direct Chrome initialization failed on macOS: {mac_error}")
                     # Fall through to the universal fallback
@@ -85,8 +449,7 @@ class RedHatEventsInteractiveScraper:
                 try:
                     driver = webdriver.Chrome(options=options)
                     logger.info(f"Chrome initialization successful on {system}")
-                    driver.implicitly_wait(10)
-                    return driver
+                    return self._prepare_driver(driver)
                 except Exception as win_error:
                     logger.warning(f"Direct Chrome initialization failed on {system}: {win_error}")
                     # Fall through to the universal fallback
@@ -98,39 +461,93 @@ class RedHatEventsInteractiveScraper:
             if use_headless:
                 options.add_argument("--headless=new")
             options.add_argument("--window-size=1920,1080")
+            self._add_load_options(options)
         
             # Create a new Chrome driver with minimal options
             driver = webdriver.Chrome(options=options)
             logger.info("Fallback method successful")
-            driver.implicitly_wait(10)
-            return driver
+            return self._prepare_driver(driver)
         
         except Exception as e:
             logger.error(f"All WebDriver initialization methods failed: {e}")
             logger.exception("WebDriver initialization error details:")
             raise Exception("Failed to initialize Chrome WebDriver on all attempts")
     
+    def _add_load_options(self, options):
+        """
+        Make pages count as loaded once the DOM is ready, and skip images if configured
+        
+        Args:
+            options (ChromeOptions): Options to update
+        """
+        # Content is waited for explicitly, so there's no need to wait for every asset
+        options.page_load_strategy = 'eager'
+        if BLOCK_PAGE_ASSETS:
+            options.add_experimental_option("prefs", {**BROWSER_PREFS, **BLOCKED_ASSET_PREFS})
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        else:
+            options.add_experimental_option("prefs", BROWSER_PREFS)
+    
+    def _prepare_driver(self, driver):
+        """
+        Apply the settings that can only be set on a running browser
+        
+        Args:
+            driver (WebDriver): Newly started driver
+            
+        Returns:
+            WebDriver: The same driver
+        """
+        driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
+        if not BLOCK_PAGE_ASSETS:
+            return driver
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not block image and font requests: {e}")
+        return driver
+    
     def take_screenshot(self, filename="screenshot.png"):
         """
-        Take a screenshot of the current browser window
+        Take a screenshot of the current browser window, if screenshots are enabled
         """
-        if self.driver:
+        # Read at call time so configure_debug_mode takes effect after import
+        if self.driver and utils.TAKE_SCREENSHOTS:
             try:
                 # Add timestamp to filename if not already present
                 if "_202" not in filename: # Check if filename already has timestamp
-                    # Get timestamp from current time
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                    timestamp = self._timestamp()
                     base, ext = os.path.splitext(filename)
                     filename = f"{base}_{timestamp}{ext}"
                 
                 screenshot_path = os.path.join(self.output_dir, filename)
-                self.driver.save_screenshot(screenshot_path)
-                logger.info(f"Screenshot saved to {screenshot_path}")
+                # Capture on this thread (the driver isn't thread-safe), but write the file in the background
+                png = self.driver.get_screenshot_as_png()
+                if self.screenshot_executor:
+                    self.screenshot_executor.submit(self._write_screenshot, screenshot_path, png)
+                else:
+                    self._write_screenshot(screenshot_path, png)
                 return screenshot_path
             except Exception as e:
                 logger.error(f"Error taking screenshot: {e}")
         return None
     
+    def _write_screenshot(self, screenshot_path, png):
+        """
+        Write captured screenshot data to disk
+    
+        Args:
+            screenshot_path (str): Path of the screenshot file
+            png (bytes): PNG data from the browser
+        """
+        try:
+            with open(screenshot_path, 'wb') as f:
+                f.write(png)
+            logger.info(f"Screenshot saved to {screenshot_path}")
+        except Exception as e:
+            logger.error(f"Error saving screenshot {screenshot_path}: {e}")
+    
     def wait_for_element(self, by, selector, timeout=10, take_screenshot=True):
         """
         Wait for an element to be present in the DOM
@@ -139,7 +556,7 @@ class RedHatEventsInteractiveScraper:
             WebElement or None: The element if found, None otherwise
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
+            element = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_SECONDS).until(
                 EC.presence_of_element_located((by, selector))
             )
             return element
@@ -160,7 +577,10 @@ class RedHatEventsInteractiveScraper:
         try:
             # Try to scroll to the element
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=WAIT_POLL_SECONDS).until(EC.element_to_be_clickable(element))
+            except TimeoutException:
+                logger.warning(f"{description} did not become clickable, clicking anyway")
             
             # Try to click with JavaScript (more reliable)
             self.driver.execute_script("arguments[0].click();", element)
@@ -177,6 +597,27 @@ class RedHatEventsInteractiveScraper:
                 self.take_screenshot(f"click_error_{description.replace(' ', '_')}.png")
                 return False
 
+    def _filter_steps(self):
+        """
+        Describe the filters to apply for APPLY_FILTERS_SCRIPT
+        
+        Returns:
+            list: One dict per set filter, see get_filter_step
+        """
+        steps = []
+        
+        # Look up the exact label text for each filter
+        if self.filters.get("event_type"):
+            event_type_text = EVENT_TYPE_LABELS.get(self.filters["event_type"], "Online")
+            steps.append(get_filter_step("Event type", event_type_text, "checkbox"))
+        if self.filters.get("region"):
+            steps.append(get_filter_step("Region", self.filters["region"], "checkbox"))
+        if self.filters.get("date"):
+            date_text = DATE_LABELS.get(self.filters["date"], "Previous events")
+            steps.append(get_filter_step("Date", date_text, "radio"))
+        
+        return steps
+    
     def apply_filters_interactively(self):
         """
         Apply filters by interacting directly with the RedHat Events interface
@@ -193,152 +634,14 @@ class RedHatEventsInteractiveScraper:
         
             # Scroll down to see the filters
             self.driver.execute_script("window.scrollBy(0, 500);")
-            time.sleep(1)
-        
-            # Select the event type
-            if "event_type" in self.filters and self.filters["event_type"]:
-                # Find and click on the Event type section expander if needed
-                event_type_header = self.driver.find_elements(By.XPATH, "//span[text()='Event type']")
-                if event_type_header:
-                    logger.info("Found Event type section header")
-                    if not self.safe_click(event_type_header[0], "Event type header"):
-                        # If clicking on the header fails, try to continue anyway
-                        logger.warning("Failed to click on Event type header, but continuing")
-                    time.sleep(1)
-            
-                # Determine the exact text to search for based on the filter
-                event_type_text = "In-person" if self.filters["event_type"] == "InPerson" else "Online"
-            
-                # Find and click on the appropriate checkbox
-                logger.info(f"Looking for {event_type_text} checkbox")
-                target_labels = self.driver.find_elements(By.XPATH, f"//label[contains(text(), '{event_type_text}')]")
-            
-                if target_labels:
-                    logger.info(f"Found {len(target_labels)} {event_type_text} labels")
-                    for label in target_labels:
-                        # Get the ID of the associated checkbox
-                        try:
-                            checkbox_id = label.get_attribute("for")
-                            if checkbox_id:
-                                checkbox = self.driver.find_element(By.ID, checkbox_id)
-                                if not checkbox.is_selected():
-                                    logger.info(f"Clicking {event_type_text} checkbox with ID: {checkbox_id}")
-                                    self.safe_click(checkbox, f"{event_type_text} checkbox")
-                                else:
-                                    logger.info(f"{event_type_text} checkbox is already selected")
-                            else:
-                                # If the for attribute doesn't exist, click on the label directly
-                                logger.info(f"Clicking {event_type_text} label directly")
-                                self.safe_click(label, f"{event_type_text} label")
-                        except Exception as e:
-                            logger.error(f"Error selecting {event_type_text} checkbox: {e}")
-                            # Try to click on the label directly as fallback
-                            self.safe_click(label, f"{event_type_text} label (fallback)")
-                        
-                    time.sleep(2)
-                else:
-                    # Try a different approach if labels weren't found
-                    type_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-                    for i, checkbox in enumerate(type_checkboxes):
-                        parent_element = self.driver.execute_script("return arguments[0].parentNode;", checkbox)
-                        if event_type_text.lower() in parent_element.text.lower():
-                            logger.info(f"Found {event_type_text} checkbox using parent text, index: {i}")
-                            self.safe_click(checkbox, f"{event_type_text} checkbox #{i}")
-                            break
-        
-            # Select the region
-            if "region" in self.filters and self.filters["region"]:
-                # Find and click on the Region section expander if needed
-                region_header = self.driver.find_elements(By.XPATH, "//span[text()='Region']")
-                if region_header:
-                    logger.info("Found Region section header")
-                    if not self.safe_click(region_header[0], "Region header"):
-                        logger.warning("Failed to click on Region header, but continuing")
-                    time.sleep(1)
-            
-                # Determine the exact text to search for
-                region_text = self.filters["region"]
-            
-                # Find and click on the region checkbox
-                logger.info(f"Looking for {region_text} checkbox")
-                region_labels = self.driver.find_elements(By.XPATH, f"//label[contains(text(), '{region_text}')]")
-            
-                if region_labels:
-                    logger.info(f"Found {len(region_labels)} {region_text} labels")
-                    for label in region_labels:
-                        try:
-                            checkbox_id = label.get_attribute("for")
-                            if checkbox_id:
-                                checkbox = self.driver.find_element(By.ID, checkbox_id)
-                                if not checkbox.is_selected():
-                                    logger.info(f"Clicking {region_text} checkbox with ID: {checkbox_id}")
-                                    self.safe_click(checkbox, f"{region_text} checkbox")
-                                else:
-                                    logger.info(f"{region_text} checkbox is already selected")
-                            else:
-                                logger.info(f"Clicking {region_text} label directly")
-                                self.safe_click(label, f"{region_text} label")
-                        except Exception as e:
-                            logger.error(f"Error selecting {region_text} checkbox: {e}")
-                            self.safe_click(label, f"{region_text} label (fallback)")
-                
-                    time.sleep(2)
-                else:
-                    # Alternative approach
-                    region_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-                    for i, checkbox in enumerate(region_checkboxes):
-                        parent_element = self.driver.execute_script("return arguments[0].parentNode;", checkbox)
-                        if region_text.lower() in parent_element.text.lower():
-                            logger.info(f"Found {region_text} checkbox using parent text, index: {i}")
-                            self.safe_click(checkbox, f"{region_text} checkbox #{i}")
-                            break
         
-            # Check if a date filter is specified
-            if "date" in self.filters and self.filters["date"]:
-                # Find and click on the Date section expander if needed
-                date_header = self.driver.find_elements(By.XPATH, "//span[text()='Date']")
-                if date_header:
-                    logger.info("Found Date section header")
-                    if not self.safe_click(date_header[0], "Date header"):
-                        logger.warning("Failed to click on Date header, but continuing")
-                    time.sleep(1)
-            
-                # Determine the exact text to search for
-                date_text = "Upcoming events" if self.filters["date"] == "Upcoming Events" else "Previous events"
-            
-                # Find and check if the correct date filter is selected
-                logger.info(f"Looking for {date_text} radio button")
-                date_labels = self.driver.find_elements(By.XPATH, f"//label[contains(text(), '{date_text}')]")
-            
-                if date_labels:
-                    logger.info(f"Found {len(date_labels)} {date_text} labels")
-                    for label in date_labels:
-                        try:
-                            radio_id = label.get_attribute("for")
-                            if radio_id:
-                                radio = self.driver.find_element(By.ID, radio_id)
-                                if not radio.is_selected():
-                                    logger.info(f"Clicking {date_text} radio with ID: {radio_id}")
-                                    self.safe_click(radio, f"{date_text} radio")
-                                else:
-                                    logger.info(f"{date_text} radio is already selected")
-                            else:
-                                logger.info(f"Clicking {date_text} label directly")
-                                self.safe_click(label, f"{date_text} label")
-                        except Exception as e:
-                            logger.error(f"Error selecting {date_text} radio: {e}")
-                            self.safe_click(label, f"{date_text} label (fallback)")
-                
-                    time.sleep(2)
-                else:
-                    # Alternative approach
-                    date_radios = self.driver.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                    for i, radio in enumerate(date_radios):
-                        parent_element = self.driver.execute_script("return arguments[0].parentNode;", radio)
-                        if date_text.lower() in parent_element.text.lower():
-                            logger.info(f"Found {date_text} radio using parent text, index: {i}")
-                            self.safe_click(radio, f"{date_text} radio #{i}")
-                            break
+            # Find and click every filter option in the page with a single script call
+            filter_steps = self._filter_steps()
+            if filter_steps:
+                self.driver.set_script_timeout(FILTER_SCRIPT_TIMEOUT)
+                for message in self.driver.execute_async_script(APPLY_FILTERS_SCRIPT, filter_steps, FILTER_WAIT_SECONDS * 1000,
+                                                                  FILTER_RESULTS_WAIT_SECONDS * 1000):
+                    logger.info(message)
         
             # Take a screenshot after selecting filters
             self.take_screenshot("after_selecting_filters.png")
@@ -348,7 +651,7 @@ class RedHatEventsInteractiveScraper:
         
             # Wait for filtered results to load
             try:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(self.driver, 10, poll_frequency=WAIT_POLL_SECONDS).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, '.rhdc-search-listing, .rh-card--layout'))
                 )
                 logger.info("Filtered results loaded successfully")
@@ -370,106 +673,88 @@ class RedHatEventsInteractiveScraper:
         Returns:
             list: List of event dictionaries
         """
+        return list(self.iter_events(html_content))
+    
+    def iter_events(self, html_content):
+        """
+        Extract event information from HTML content one card at a time
+        
+        Args:
+            html_content (str): HTML content to parse
+            
+        Yields:
+            dict: Event dictionary for each card with a valid title
+        """
         if not html_content:
             logger.error("No HTML content to parse")
-            return []
+            return
         
-        events = []
-        soup = BeautifulSoup(html_content, 'lxml')
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=CARD_STRAINER)
         
         # Save HTML for debugging
-        save_html_for_debugging(html_content, "debug_redhat_page_interactive.html")
+        save_html_for_debugging(html_content, "debug_redhat_page_interactive.html.gz")
         
         # Search for events on the page
-        all_selectors = [
-            # Selectors for filtered event cards
-            'div.rh-card--layout',
-            # Selectors for events on the home page
-            '.pf-v5-c-card',
-            '.pf-c-card',
-            '.card',
-            'div[class*="card"]',
-            'div[class*="event"]',
-            # Other possible selectors
-            '.eventcard',
-            'article.event',
-            '.node--type-event'
-        ]
-        
-        for selector in all_selectors:
-            event_cards = soup.select(selector)
+        for selector in CARD_SELECTORS:
+            event_cards = selector.select(soup)
             if event_cards:
-                logger.info(f"Found {len(event_cards)} event cards with selector '{selector}'")
+                logger.info(f"Found {len(event_cards)} event cards with selector '{selector.pattern}'")
                 break
         else:
             event_cards = []
             logger.info("No event cards found with any selector")
         
+        # Which field selector matched each card, logged per page to show which fallbacks are still used
+        selector_hits = Counter()
+        
         for card in event_cards:
             try:
                 # Initialize event data
                 event = {}
                 
-                # Use different selectors to extract the event type
-                type_selectors = [
-                    '.rh-card-header-title-small', 
-                    '.card-header', 
-                    'h4',
-                    '.rh-card-header--component h3',
-                    # Selectors based on the screenshot
-                    '.rh-card-header',
-                    'div[class*="card-header"]',
-                    'div[class*="header"]'
-                ]
+                # Text strings and links of the card, collected by the first fallback that needs them
+                card_strings = None
+                card_links = None
                 
-                for selector in type_selectors:
-                    type_elem = card.select_one(selector)
+                # Use different selectors to extract the event type
+                for selector in TYPE_SELECTORS:
+                    type_elem = selector.select_one(card)
                     if type_elem:
                         event['type'] = clean_text(type_elem.text)
+                        selector_hits[selector.pattern] += 1
                         break
                 else:
                     # Check for direct "ONLINE" or "IN-PERSON" header in the card
-                    online_headers = card.find_all(string=re.compile(r'ONLINE|IN-PERSON|IN PERSON', re.IGNORECASE))
-                    if online_headers:
-                        event['type'] = clean_text(online_headers[0])
+                    if card_strings is None:
+                        card_strings = list(card.stripped_strings)
+                    online_header = next((text for text in card_strings if EVENT_TYPE_RE.search(text)), None)
+                    if online_header:
+                        event['type'] = clean_text(online_header)
                     else:
                         event['type'] = "N/A"
                 
                 # Use different selectors to extract the title
-                title_selectors = [
-                    '.rh-featured-event-teaser-headline-secondary a',
-                    'h2 a', 
-                    'h3 a', 
-                    '.card-title a', 
-                    'a[href*="events"]',
-                    # Additional title selectors
-                    'h2', 'h3', '.card-title', '.event-title',
-                    '[class*="title"]'
-                ]
-                
-                for selector in title_selectors:
-                    title_elems = card.select(selector)
+                for selector in TITLE_SELECTORS:
+                    title_elems = selector.select(card)
                     if title_elems:
                         for title_elem in title_elems:
                             # Only get titles that are not "ONLINE" or "IN-PERSON"
-                            if not re.match(r'^\s*(ONLINE|IN-PERSON|IN PERSON)\s*$', title_elem.text, re.IGNORECASE):
+                            if not EVENT_TYPE_ONLY_RE.match(title_elem.text):
                                 event['title'] = clean_text(title_elem.text)
                                 
                                 # Extract the link to the event
                                 if title_elem.name == 'a':
                                     event['link'] = title_elem.get('href', 'N/A')
                                 else:
-                                    # If the element isn't an <a>, look for a link inside it or its parent
-                                    link = title_elem.find('a') or title_elem.parent.find('a')
+                                    # If the element isn't an <a>, look for a link inside it or its parent,
+                                    # then for any link in the card
+                                    if card_links is None:
+                                        card_links = card.find_all('a')
+                                    link = self._find_title_link(title_elem, card, card_links)
                                     if link:
                                         event['link'] = link.get('href', 'N/A')
                                     else:
-                                        # Look for any link in the card
-                                        any_link = card.find('a')
-                                        if any_link:
-                                            event['link'] = any_link.get('href', 'N/A')
-                                        else:
-                                            event['link'] = "N/A"
+                                        event['link'] = "N/A"
                                             
                                 if event['link'] and event['link'].startswith('/'):
                                     event['link'] = f"https://www.redhat.com{event['link']}"
@@ -477,19 +762,24 @@ class RedHatEventsInteractiveScraper:
                                 break
                         
                         if 'title' in event:
+                            selector_hits[selector.pattern] += 1
                             break
                 
                 if 'title' not in event:
                     # If no title was found, use any text that might be a title
-                    potential_titles = [e for e in card.find_all(text=True) if len(e.strip()) > 5 
-                                        and not re.match(r'^\s*(ONLINE|IN-PERSON|IN PERSON|WATCH|REGISTER)\s*$', e, re.IGNORECASE)]
-                    if potential_titles:
-                        event['title'] = clean_text(potential_titles[0])
+                    if card_strings is None:
+                        card_strings = list(card.stripped_strings)
+                    potential_title = next((text for text in card_strings if len(text) > 5
+                                            and not NON_TITLE_RE.match(text)), None)
+                    if potential_title:
+                        event['title'] = clean_text(potential_title)
                     else:
                         event['title'] = "N/A"
                     
                     # Look for any link
-                    any_link = card.find('a')
+                    if card_links is None:
+                        card_links = card.find_all('a')
+                    any_link = card_links[0] if card_links else None
                     if any_link:
                         event['link'] = any_link.get('href', 'N/A')
                         if event['link'].startswith('/'):
@@ -498,38 +788,21 @@ class RedHatEventsInteractiveScraper:
                         event['link'] = "N/A"
                 
                 # Use different selectors to extract the date
-                date_selectors = [
-                    '.rh-featured-event-teaser-date-secondary',
-                    'time', 
-                    '.date', 
-                    '.card-date',
-                    # Additional date selectors
-                    '[class*="date"]',
-                    '[datetime]'
-                ]
-                
-                for selector in date_selectors:
-                    date_elem = card.select_one(selector)
+                for selector in DATE_SELECTORS:
+                    date_elem = selector.select_one(card)
                     if date_elem:
                         event['date_range'] = clean_text(date_elem.text)
+                        selector_hits[selector.pattern] += 1
                         break
                 else:
                     # Look for text that resembles a date
-                    date_patterns = [
-                        r'\w+ \d+, \d{4}',  # January 1, 2025
-                        r'\d{1,2}/\d{1,2}/\d{2,4}',  # 1/1/2025
-                        r'\d{4}-\d{2}-\d{2}'  # 2025-01-01
-                    ]
-                    
-                    for text in card.stripped_strings:
-                        for pattern in date_patterns:
-                            if re.search(pattern, text):
-                                event['date_range'] = clean_text(text)
-                                break
-                        if 'date_range' in event:
+                    if card_strings is None:
+                        card_strings = list(card.stripped_strings)
+                    for text in card_strings:
+                        if DATE_RE.search(text):
+                            event['date_range'] = clean_text(text)
                             break
-                    
-                    if 'date_range' not in event:
+                    else:
                         event['date_range'] = "N/A"
                 
                 # Parse the date range
@@ -540,26 +813,19 @@ class RedHatEventsInteractiveScraper:
                 event['location'] = event['type']
                 
                 # Use different selectors to extract the action (Watch, Learn more, etc.)
-                action_selectors = [
-                    '.rh-cta-link',
-                    'a.button',
-                    '.button',
-                    'a.cta',
-                    '.cta-link',
-                    '[class*="button"]',
-                    '[class*="cta"]'
-                ]
-                
-                for selector in action_selectors:
-                    action_elem = card.select_one(selector)
+                for selector in ACTION_SELECTORS:
+                    action_elem = selector.select_one(card)
                     if action_elem:
                         event['action'] = clean_text(action_elem.text)
+                        selector_hits[selector.pattern] += 1
                         break
                 else:
                     # Try to find any button-like text
-                    button_texts = card.find_all(string=re.compile(r'WATCH|LEARN|REGISTER', re.IGNORECASE))
-                    if button_texts:
-                        event['action'] = clean_text(button_texts[0])
+                    if card_strings is None:
+                        card_strings = list(card.stripped_strings)
+                    button_text = next((text for text in card_strings if BUTTON_TEXT_RE.search(text)), None)
+                    if button_text:
+                        event['action'] = clean_text(button_text)
                     else:
                         event['action'] = "N/A"
                 
@@ -567,15 +833,71 @@ class RedHatEventsInteractiveScraper:
                 event['description'] = ""
                 
                 # Only add events with valid titles and filter out "Event Type" items
-                if event['title'] != "N/A" and event['title'].lower() != "event type":
-                    events.append(event)
-                    logger.info(f"Extracted event: {event['title']} - Type: {event['type']} - Date: {event['date_range']} - Location: {event['location']} - Link: {event.get('link', 'N/A')}")
+                if event['title'] == "N/A" or event['title'].lower() == "event type":
+                    continue
+                
+                # Share one string object for values that repeat across many events
+                for field in INTERNED_FIELDS:
+                    value = event.get(field)
+                    if isinstance(value, str):
+                        event[field] = sys.intern(value)
+                
+                # Fingerprint once here so comparing with the last run doesn't rehash every event
+                event['_fp'] = event_fingerprint(event)
+                logger.debug(f"Extracted event: {event['title']} - Type: {event['type']} - Date: {event['date_range']} - Location: {event['location']} - Link: {event.get('link', 'N/A')}")
             
             except Exception as e:
                 logger.error(f"Error extracting event data: {e}")
                 continue
+            
+            # Yield outside the try so errors in the consumer aren't reported as extraction errors
+            yield event
+        
+        logger.debug(f"Selector hits for {len(event_cards)} cards: {dict(selector_hits)}")
+    
+    def _find_title_link(self, title_elem, card, card_links):
+        """
+        Pick the link for a title element from the card's links, in one pass
         
-        return events
+        Args:
+            title_elem (Tag): Title element that isn't a link itself
+            card (Tag): Event card containing the title
+            card_links (list): All links in the card, in document order
+            
+        Returns:
+            Tag or None: First link inside the title, else first link inside its parent,
+                         else first link in the card
+        """
+        parent = title_elem.parent
+        parent_link = None
+        for link in card_links:
+            for ancestor in link.parents:
+                if ancestor is title_elem:
+                    return link
+                if ancestor is parent or ancestor is card:
+                    if ancestor is parent and parent_link is None:
+                        parent_link = link
+                    break
+        if parent_link is not None:
+            return parent_link
+        return card_links[0] if card_links else None
+    
+    def get_card_html(self):
+        """
+        Get the HTML of the event cards on the page in the browser
+        
+        Returns:
+            str or None: HTML document with just the cards, or None if no card was found
+        """
+        try:
+            selectors = [selector.pattern for selector in CARD_SELECTORS]
+            cards_html = self.driver.execute_script(CARD_HTML_SCRIPT, selectors)
+        except Exception as e:
+            logger.warning(f"Error reading event cards from the browser: {e}")
+            return None
+        if not cards_html:
+            return None
+        return f"<html><body>{cards_html}</body></html>"
     
     def get_next_page_url(self):
         """
@@ -585,49 +907,97 @@ class RedHatEventsInteractiveScraper:
             str: URL of next page, or None if there's no next page
         """
         try:
-            # Reduce the number of selectors and optimize the search
-            # Use only the most likely selectors
-            for selector in [
-                'a[data-testid="pager-next"]', 
-                'a[aria-label="Next"]',
-                'a.next'
-            ]:
-                next_buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for btn in next_buttons:
-                    # Skip disabled buttons
-                    if btn.get_attribute('aria-disabled') == 'true':
-                        continue
-                    return btn.get_attribute('href')
-        
-            # Simplified text search to be faster
-            next_buttons = self.driver.find_elements(By.XPATH, "//a[contains(., 'Next')]")
-            for btn in next_buttons:
-                if btn.get_attribute('aria-disabled') != 'true':
-                    return btn.get_attribute('href')
-        
-            # No next page found
-            return None
+            # One script call instead of a round-trip per link and attribute
+            selectors = [selector.pattern for selector in NEXT_PAGE_SELECTORS]
+            return self.driver.execute_script(NEXT_PAGE_SCRIPT, selectors)
         except Exception as e:
             # Add error log for potential issues
             logger.debug(f"Error checking for next page: {e}")
             return None
     
+    def get_next_page_url_from_html(self, html_content, page_url):
+        """
+        Find the next page link in a results page fetched over HTTP
+        
+        Args:
+            html_content (str): HTML content of the results page
+            page_url (str): URL of the results page, to resolve relative links
+            
+        Returns:
+            str: URL of next page, or None if there's no next page
+        """
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=SoupStrainer('a'))
+        for selector in NEXT_PAGE_SELECTORS:
+            for btn in selector.select(soup):
+                if btn.get('aria-disabled') != 'true' and btn.get('href'):
+                    return urljoin(page_url, btn['href'])
+        for btn in soup.find_all('a', href=True):
+            if 'Next' in btn.get_text() and btn.get('aria-disabled') != 'true':
+                return urljoin(page_url, btn['href'])
+        return None
+    
+    def fetch_results_page(self, session, url):
+        """
+        Fetch a results page over plain HTTP instead of rendering it in the browser
+        
+        Args:
+            session (requests.Session): Session shared by the results pages of a scrape
+            url (str): URL of the results page, with the filters in its query
+            
+        Returns:
+            str or None: Page HTML, or None if the page has no server-rendered event cards
+        """
+        try:
+            response = session.get(url, timeout=REQUEST_TIMEOUT)
+            # Retry server errors with backoff, so a brief outage doesn't move the rest of the
+            # scrape back into the browser
+            for attempt in range(RESULTS_PAGE_RETRIES):
+                if response.status_code < 500:
+                    break
+                delay = RESULTS_PAGE_RETRY_DELAY * 2 ** attempt
+                logger.warning(f"Status {response.status_code} fetching {url}, retrying in {delay} seconds")
+                time.sleep(delay)
+                response = session.get(url, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                logger.warning(f"Unexpected status {response.status_code} fetching {url}")
+                return None
+            if 'rh-card--layout' not in response.text:
+                logger.info("Results page has no event cards without JavaScript")
+                return None
+            return response.text
+        except Exception as e:
+            logger.warning(f"Error fetching {url}: {e}")
+            return None
+    
     def scrape(self):
         """
         Main scraping function using interactive filtering
         """
         all_events = []
+        http_session = None
+        scrape_failed = False
+        driver_key = (self.browser_type, self.headless)
+        self.screenshot_executor = ThreadPoolExecutor(max_workers=2)
     
         try:
-            # Initialize the WebDriver
-            self.driver = self.setup_driver()
+            # Reuse a browser from an earlier scrape, or start a new one
+            self.driver = acquire_driver(driver_key)
+            if self.driver:
+                logger.info("Reusing open browser")
+            else:
+                self.driver = self.setup_driver()
         
             # Navigate to base URL
             logger.info(f"Navigating to base URL: {self.base_url}")
             self.driver.get(self.base_url)
         
-            # Wait for page to load - reduced to 3 seconds
-            time.sleep(3)
+            # Wait for the listing to render instead of a fixed pause
+            try:
+                WebDriverWait(self.driver, 10, poll_frequency=WAIT_POLL_SECONDS).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, '.rh-card--layout, .rhdc-search-listing'))
+                )
+            except TimeoutException:
+                logger.warning("Timeout waiting for the events listing to load")
         
             # Apply filters interactively
             self.apply_filters_interactively()
@@ -637,53 +1007,84 @@ class RedHatEventsInteractiveScraper:
         
             page = 0
             max_pages = 10  # Safety limit
+            
+            # Results pages after the first are fetched over plain HTTP while they come back
+            # with server-rendered cards, with the browser's cookies so the filters still apply
+            if requests is not None:
+                http_session = requests.Session()
+                http_session.headers.update(HEADERS)
+                for cookie in self.driver.get_cookies():
+                    http_session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
+            use_http = http_session is not None
+            # HTML of the current page when it was fetched over HTTP, None when it is in the browser
+            html_content = None
+            # URL of the current page, relative links in fetched HTML are resolved against it
+            page_url = self.driver.current_url
+            # Fingerprints of the events collected so far, pages that repeat them add nothing
+            seen_fingerprints = set()
         
             while page < max_pages:
                 page += 1
-                logger.info(f"Processing page {page}")
-            
-                # Wait for content to load - reduced wait time
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, '.rh-divider-content, .rhdc-search-listing, .rh-card--layout'))
-                    )
-                    # Reduced wait after page load
-                    time.sleep(1)
-                except TimeoutException:
-                    logger.warning(f"Timeout waiting for page content to load on page {page}")
-                    self.take_screenshot(f"timeout_page{page}.png")
-            
-                # Get page HTML
-                html_content = self.driver.page_source
+                logger.debug(f"Processing page {page}")
+                
+                if html_content is None:
+                    # Wait for content to load - reduced wait time
+                    try:
+                        WebDriverWait(self.driver, 10, poll_frequency=WAIT_POLL_SECONDS).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, '.rh-divider-content, .rhdc-search-listing, .rh-card--layout'))
+                        )
+                        # Reduced wait after page load
+                        time.sleep(1)
+                    except TimeoutException:
+                        logger.warning(f"Timeout waiting for page content to load on page {page}")
+                        self.take_screenshot(f"timeout_page{page}.png")
+                
+                    # Get the cards' HTML, or the whole page when there are none so it is
+                    # saved for debugging
+                    page_html = self.get_card_html() or self.driver.page_source
+                else:
+                    page_html = html_content
             
-                # Extract events
-                events = self.extract_events(html_content)
+                # Extract events straight into the results, without a list per page
+                events_before = len(all_events)
+                for event in self.iter_events(page_html):
+                    if event['_fp'] in seen_fingerprints:
+                        continue
+                    seen_fingerprints.add(event['_fp'])
+                    all_events.append(event)
+                page_event_count = len(all_events) - events_before
             
-                if not events:
-                    logger.info(f"No events found on page {page}, stopping pagination")
+                # Also stops when the pager wraps around or repeats its last page
+                if not page_event_count:
+                    logger.info(f"No new events found on page {page}, stopping pagination")
                     break
             
-                # Add events from this page
-                all_events.extend(events)
-                logger.info(f"Found {len(events)} events on page {page}")
-            
                 # Check for next page - optimized and faster verification
-                logger.info("Checking for next page...")
-                next_url = self.get_next_page_url()
+                if html_content is None:
+                    next_url = self.get_next_page_url()
+                else:
+                    next_url = self.get_next_page_url_from_html(html_content, page_url)
+                
+                # One summary line per page
+                logger.info(f"Page {page}: {page_event_count} events, next page: {next_url or 'none'}")
             
                 if not next_url:
-                    logger.info("No next page found, stopping pagination")
                     # Message indicating the end of pagination and start of cleanup
                     logger.info("Finalizing scraping process...")
                     break
             
                 # Move to next page
-                logger.info(f"Moving to next page: {next_url}")
-                self.driver.get(next_url)
-                # Reduced wait after navigation
-                time.sleep(1.5)
+                html_content = self.fetch_results_page(http_session, next_url) if use_http else None
+                page_url = next_url
+                if html_content is None:
+                    # Render this and the remaining pages in the browser
+                    use_http = False
+                    # get() returns once the new document is ready, its cards are waited for
+                    # at the top of the loop
+                    self.driver.get(next_url)
     
         except Exception as e:
+            scrape_failed = True
             logger.error(f"Error during scraping: {e}")
             logger.exception("Detailed stack trace:")
             self.take_screenshot("error_during_scraping.png")
@@ -691,26 +1092,36 @@ class RedHatEventsInteractiveScraper:
             # Export what we have if an error occurs
             if all_events and self.processor:
                 # Export what we have collected to Excel
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"redhat_events_all_{timestamp}.xlsx"
-                excel_path = self.processor.export_to_excel(all_events, filename)
+                excel_path = self.processor.export_to_excel(all_events, timestamp=self._timestamp())
                 logger.info(f"Exported {len(all_events)} events to Excel: {excel_path}")
     
         finally:
             # Clean up - add logs to know what's happening during closure
             logger.info("Cleaning up resources...")
-            if self.driver:
-                logger.info("Closing browser...")
+            if self.driver and self.attached:
+                # Leave the shared browser running, only stop this run's chromedriver
+                logger.info("Detaching from running browser...")
                 try:
-                    # Close with timeout to avoid blocking
-                    self.driver.set_page_load_timeout(10)
-                    self.driver.set_script_timeout(10)
-                    self.driver.quit()
+                    self.driver.get("about:blank")
+                    self.driver.service.stop()
                 except Exception as e:
-                    logger.warning(f"Error while closing browser: {e}")
-                finally:
-                    self.driver = None
+                    logger.warning(f"Error while detaching from browser: {e}")
+                self.driver = None
+                self.attached = False
+            elif self.driver:
+                # A browser that hit an error isn't trusted for the next scrape
+                if not scrape_failed and release_driver(driver_key, self.driver):
+                    logger.info("Browser kept open for the next scrape")
+                else:
+                    logger.info("Closing browser...")
+                    quit_driver(self.driver)
                     logger.info("Browser closed")
+                self.driver = None
+            if http_session:
+                http_session.close()
+            # Make sure every screenshot is on disk before the caller cleans up old ones
+            self.screenshot_executor.shutdown(wait=True)
+            self.screenshot_executor = None
     
         logger.info(f"Total scraped events: {len(all_events)}")
         return all_events
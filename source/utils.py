@@ -3,11 +3,66 @@ import os
 import re
 import logging
 import json
+import hashlib
+import gzip
+import functools
 from datetime import datetime
-from dateutil import parser
+from logging.handlers import RotatingFileHandler
+
+from config import LOG_MAX_BYTES, LOG_BACKUP_COUNT
+
+try:
+    import json_stream
+except ImportError:
+    json_stream = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Last run files up to this size (bytes) are read in one go rather than streamed
+STREAM_LOAD_THRESHOLD = 16 * 1024 * 1024
+
+# Whether the scraper saves browser screenshots, off unless turned on by configure_debug_mode
+TAKE_SCREENSHOTS = False
+
+# Patterns applied to every scraped event, compiled once
+WHITESPACE_RE = re.compile(r'\s+')
+# Parenthesized notes in date strings, such as the timezone in "(UTC)"
+PARENTHESIZED_RE = re.compile(r'\([^)]*\)')
+
+# Date formats used on the events pages, tried with strptime before dateutil's slower
+# general-purpose parser
+DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%B %d %Y")
+
+def configure_logging(log_file):
+    """
+    Log to a size-capped log file and the console, unless logging is already configured
+    
+    Args:
+        log_file (str): Path of the log file
+    """
+    # Checked first so a second call doesn't open another handle on the log file
+    if logging.getLogger().handlers:
+        return
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT),
+            logging.StreamHandler()
+        ]
+    )
+
 def ensure_directory(directory):
     """
     Ensure that the specified directory exists
@@ -22,13 +77,10 @@ def ensure_directory(directory):
     try:
         # Use absolute path to avoid relative path issues
         abs_dir = os.path.abspath(directory)
-        logger.info(f"Ensuring directory exists: {abs_dir}")
         
-        if not os.path.exists(abs_dir):
-            os.makedirs(abs_dir)
-            logger.info(f"Created directory: {abs_dir}")
-        else:
-            logger.info(f"Directory already exists: {abs_dir}")
+        # One call that also tolerates another process creating the directory first
+        os.makedirs(abs_dir, exist_ok=True)
+        logger.debug(f"Ensured directory exists: {abs_dir}")
     except Exception as e:
         logger.error(f"Error creating directory {directory}: {e}", exc_info=True)
 
@@ -45,7 +97,26 @@ def clean_text(text):
     if not text:
         return ""
     # Replace multiple spaces with a single space
-    return re.sub(r'\s+', ' ', text.strip())
+    return WHITESPACE_RE.sub(' ', text.strip())
+
+def _parse_date(date_str):
+    """
+    Parse a single date, trying the known formats before dateutil
+    
+    Args:
+        date_str (str): Date string to parse
+        
+    Returns:
+        datetime: Parsed date
+    """
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            pass
+    # Imported on first use, most dates never need it
+    from dateutil import parser
+    return parser.parse(date_str)
 
 def parse_date_range(date_string):
     """
@@ -62,7 +133,7 @@ def parse_date_range(date_string):
     
     try:
         # Remove timezone information in parentheses
-        cleaned = re.sub(r'\([^)]*\)', '', date_string).strip()
+        cleaned = PARENTHESIZED_RE.sub('', date_string).strip()
         
         # Handle various formats
         if '-' in cleaned:
@@ -70,10 +141,10 @@ def parse_date_range(date_string):
             start_str = parts[0].strip()
             end_str = parts[1].strip()
             
-            # Try to parse with dateutil
+            # Try to parse with the known formats, then dateutil
             try:
-                start_date = parser.parse(start_str)
-                end_date = parser.parse(end_str)
+                start_date = _parse_date(start_str)
+                end_date = _parse_date(end_str)
             except:
                 # Fallback for unusual formats
                 logger.warning(f"Using fallback date parsing for: {date_string}")
@@ -85,15 +156,15 @@ def parse_date_range(date_string):
                 }
             
             return {
-                "start_date": start_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d")
+                "start_date": start_date.date().isoformat(),
+                "end_date": end_date.date().isoformat()
             }
         else:
             # Single date
-            date = parser.parse(cleaned)
+            date = _parse_date(cleaned).date().isoformat()
             return {
-                "start_date": date.strftime("%Y-%m-%d"),
-                "end_date": date.strftime("%Y-%m-%d")
+                "start_date": date,
+                "end_date": date
             }
     except Exception as e:
         logger.error(f"Error parsing date: {date_string}, Error: {e}")
@@ -103,84 +174,135 @@ def parse_date_range(date_string):
             "end_date": None
         }
 
-def compare_events(new_events, previous_events):
+def event_fingerprint(event):
+    """
+    Compute a stable fingerprint identifying an event across runs
+    
+    Args:
+        event (dict): Event dictionary
+        
+    Returns:
+        str: Short hex digest of the event's title, start date and link
+    """
+    key = f"{event.get('title', '')}|{event.get('start_date', '')}|{event.get('link', '')}"
+    return hashlib.blake2s(key.encode('utf-8'), digest_size=8).hexdigest()
+
+def _stored_fingerprint(item):
+    """
+    Get the fingerprint of an event or of a stored last run entry
+    
+    Args:
+        item (dict or str): Event dictionary, or a fingerprint saved by save_last_run_data
+        
+    Returns:
+        str: Fingerprint of the event
+    """
+    if isinstance(item, str):
+        return item
+    return item.get('_fp') or event_fingerprint(item)
+
+def events_digest(events):
+    """
+    Compute a digest of the full content of an event list.
+    Uses BLAKE3 when it is installed, SHA-256 otherwise.
+    
+    Args:
+        events (list): List of event dictionaries
+        
+    Returns:
+        str: Hex digest of the serialized events
+    """
+    if orjson is not None:
+        serialized = orjson.dumps(events, default=str, option=orjson.OPT_SORT_KEYS)
+    else:
+        serialized = json.dumps(events, sort_keys=True, default=str).encode('utf-8')
+    if blake3 is not None:
+        return blake3.blake3(serialized).hexdigest()
+    return hashlib.sha256(serialized).hexdigest()
+
+def compare_events(new_events, previous_events, copy=False):
     """
     Compare new events with previously scraped events to identify new ones.
     Add an 'is_new' flag to events that weren't in the previous scrape.
     
     Args:
         new_events (list): List of newly scraped events
-        previous_events (list): List of previously scraped events
+        previous_events (iterable): Previously scraped events or their fingerprints, consumed only once
+        copy (bool): Flag copies of the events instead of the events themselves
         
     Returns:
         tuple: (List of new events only, List of all events with 'is_new' flag)
     """
-    if not previous_events:
-        # If no previous events, all are new
-        new_only = new_events.copy()
-        # Add 'is_new' flag to all events
-        all_with_flag = []
-        for event in new_events:
-            event_copy = event.copy()
-            event_copy['is_new'] = True
-            all_with_flag.append(event_copy)
-        return new_only, all_with_flag
-    
-    # Create a set of unique identifiers for previous events
-    # Using title and start_date as a unique identifier
-    previous_ids = {f"{event.get('title', '')}-{event.get('start_date', '')}" for event in previous_events}
+    # Fingerprint the previous events once so each lookup below is O(1)
+    # If there are no previous events the set is empty and all events are new
+    previous_ids = frozenset(_stored_fingerprint(item) for item in previous_events or ())
     
-    # Filter new events to only include those not in previous events
     new_only = []
     all_with_flag = []
     
     for event in new_events:
-        event_id = f"{event.get('title', '')}-{event.get('start_date', '')}"
-        event_copy = event.copy()
+        is_new = _stored_fingerprint(event) not in previous_ids
+        if copy:
+            event = event.copy()
+        event['is_new'] = is_new
         
-        if event_id not in previous_ids:
-            event_copy['is_new'] = True
-            new_only.append(event_copy)
-        else:
-            event_copy['is_new'] = False
+        if is_new:
+            new_only.append(event)
         
-        all_with_flag.append(event_copy)
+        all_with_flag.append(event)
     
     return new_only, all_with_flag
 
 def save_last_run_data(events, filename="last_run_data.json"):
     """
-    Save data from the last scraping run to compare in future runs
+    Save data from the last scraping run to compare in future runs.
+    Only the event fingerprints are stored, that's all compare_events needs.
     
     Args:
         events (list): List of events from the current run
         filename (str): Filename to save the data to
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(events, f, ensure_ascii=False, indent=2)
+        fingerprints = [_stored_fingerprint(event) for event in events]
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(fingerprints, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(fingerprints, f, indent=2)
         logger.info(f"Saved last run data to {filename}")
     except Exception as e:
         logger.error(f"Error saving last run data: {e}")
 
 def load_last_run_data(filename="last_run_data.json"):
     """
-    Load data from the last scraping run
+    Load data from the last scraping run.
+    Small files are parsed in one go with orjson when it is installed. Larger ones
+    are streamed one event at a time with json-stream when it is installed, so the
+    whole previous run never has to be held in memory.
     
     Args:
         filename (str): Filename to load the data from
         
-    Returns:
-        list: List of events from the last run, or empty list if file doesn't exist
+    Yields:
+        str or dict: Event fingerprints from the last run (full events for files
+        written by older versions), nothing if the file doesn't exist
     """
     try:
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+        if not os.path.exists(filename):
+            return
+        if orjson is not None and (json_stream is None or os.path.getsize(filename) <= STREAM_LOAD_THRESHOLD):
+            with open(filename, 'rb') as f:
+                yield from orjson.loads(f.read())
+            return
+        with open(filename, 'r', encoding='utf-8') as f:
+            if json_stream is None:
+                yield from json.load(f)
+                return
+            for event in json_stream.load(f):
+                yield json_stream.to_standard_types(event)
     except Exception as e:
         logger.error(f"Error loading last run data: {e}")
-        return []
 
 def generate_filename(prefix="redhat_events", extension="xlsx"):
     """
@@ -202,10 +324,12 @@ def save_html_for_debugging(html_content, filename="debug_redhat_page.html"):
     
     Args:
         html_content (str): HTML content to save
-        filename (str): Filename to save the content to
+        filename (str): Filename to save the content to, gzip-compressed if it ends in .gz
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
+        # Fastest compression level, HTML shrinks a lot even at level 1
+        opener = functools.partial(gzip.open, compresslevel=1) if filename.endswith('.gz') else open
+        with opener(filename, 'wt', encoding='utf-8') as f:
             f.write(html_content)
         logger.info(f"Saved HTML content to {filename} for debugging")
     except Exception as e:
@@ -221,29 +345,28 @@ def clean_screenshots(directory, current_timestamp=None):
         current_timestamp (str): Current session timestamp to preserve (format: YYYYMMDD_HHMMSS)
     """
     try:
-        # Find all screenshot files
-        screenshot_files = [os.path.join(directory, f) for f in os.listdir(directory) 
-                          if f.endswith('.png')]
-        
-        # Count before cleaning
-        total_count = len(screenshot_files)
+        total_count = 0
         removed_count = 0
         
-        # Remove screenshots from previous sessions
-        for file_path in screenshot_files:
-            file_name = os.path.basename(file_path)
-            
-            # If current_timestamp is provided, keep screenshots from current session
-            if current_timestamp and current_timestamp in file_name:
-                logger.debug(f"Keeping current screenshot: {file_name}")
-                continue
+        # Single pass over the directory, the decision only depends on the file name
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                file_name = entry.name
+                if not file_name.endswith('.png'):
+                    continue
+                total_count += 1
                 
-            try:
-                os.remove(file_path)
-                removed_count += 1
-                logger.debug(f"Removed screenshot: {file_name}")
-            except Exception as e:
-                logger.warning(f"Could not remove screenshot {file_name}: {e}")
+                # If current_timestamp is provided, keep screenshots from current session
+                if current_timestamp and current_timestamp in file_name:
+                    logger.debug(f"Keeping current screenshot: {file_name}")
+                    continue
+                    
+                try:
+                    os.remove(entry.path)
+                    removed_count += 1
+                    logger.debug(f"Removed screenshot: {file_name}")
+                except Exception as e:
+                    logger.warning(f"Could not remove screenshot {file_name}: {e}")
         
         if removed_count > 0:
             logger.info(f"Cleaned {removed_count}/{total_count} screenshot files")